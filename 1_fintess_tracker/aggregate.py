@@ -0,0 +1,109 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field, fields
+from datetime import date
+from typing import Dict, List, Union
+
+from homework import InfoMessage, read_package
+
+CHECKPOINT_VERSION: int = 1
+
+
+def week_key(day: date) -> str:
+    """Вернуть ключ ISO-недели вида `2023-W07`."""
+    year, week, _ = day.isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+@dataclass
+class Totals:
+    """Накопленные итоги тренировок."""
+    trainings: int = 0
+    duration: float = 0.0
+    distance: float = 0.0
+    calories: float = 0.0
+
+    def add(self, info: InfoMessage) -> None:
+        """Учесть результаты одной тренировки."""
+        self.trainings += 1
+        self.duration += info.duration
+        self.distance += info.distance
+        self.calories += info.calories
+
+
+@dataclass
+class AthleteTotals:
+    """Итоги спортсмена: за всё время и по неделям."""
+    total: Totals = field(default_factory=Totals)
+    weeks: Dict[str, Totals] = field(default_factory=dict)
+
+    def add(self, info: InfoMessage, week: str) -> None:
+        """Учесть тренировку в общих и недельных итогах."""
+        self.total.add(info)
+        self.weeks.setdefault(week, Totals()).add(info)
+
+    def weekly_average(self) -> Dict[str, float]:
+        """Посчитать средние итоги за неделю с тренировками."""
+        weeks = len(self.weeks)
+        return {item.name: getattr(self.total, item.name) / weeks
+                if weeks else 0.0
+                for item in fields(Totals)}
+
+
+class TrainingAggregator:
+    """Инкрементальные итоги тренировок по спортсменам.
+
+    Каждая новая тренировка обновляет итоги за O(1), поэтому запросы
+    не требуют пересчёта всей истории. Состояние сохраняется
+    в JSON-файл и восстанавливается из него.
+    """
+
+    def __init__(self) -> None:
+        self.athletes: Dict[str, AthleteTotals] = {}
+
+    def add(self, athlete_id: str, info: InfoMessage, day: date) -> None:
+        """Учесть результаты тренировки спортсмена."""
+        athlete = self.athletes.setdefault(athlete_id, AthleteTotals())
+        athlete.add(info, week_key(day))
+
+    def add_package(self,
+                    athlete_id: str,
+                    workout_type: str,
+                    data: List[Union[int, float]],
+                    day: date
+                    ) -> InfoMessage:
+        """Посчитать пакет от датчиков и учесть его в итогах."""
+        info = read_package(workout_type, data).show_training_info()
+        self.add(athlete_id, info, day)
+        return info
+
+    def totals(self, athlete_id: str) -> AthleteTotals:
+        """Вернуть итоги спортсмена."""
+        return self.athletes.get(athlete_id, AthleteTotals())
+
+    def save(self, path: str) -> None:
+        """Атомарно сохранить состояние в файл."""
+        state = {'version': CHECKPOINT_VERSION,
+                 'athletes': {athlete_id: asdict(athlete)
+                              for athlete_id, athlete
+                              in self.athletes.items()}}
+        temporary = f'{path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(state, file, ensure_ascii=False)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'TrainingAggregator':
+        """Восстановить состояние из файла."""
+        with open(path, encoding='utf-8') as file:
+            state = json.load(file)
+        if state.get('version') != CHECKPOINT_VERSION:
+            raise ValueError('Неподдерживаемая версия файла состояния.')
+        aggregator = cls()
+        for athlete_id, athlete in state['athletes'].items():
+            aggregator.athletes[athlete_id] = AthleteTotals(
+                Totals(**athlete['total']),
+                {week: Totals(**totals)
+                 for week, totals in athlete['weeks'].items()}
+            )
+        return aggregator
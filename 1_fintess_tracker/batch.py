@@ -0,0 +1,206 @@
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from homework import InfoMessage, Running, SportsWalking, Swimming
+from stream import Package
+
+WORKOUT_NAMES: dict[str, str] = {'SWM': Swimming.__name__,
+                                 'RUN': Running.__name__,
+                                 'WLK': SportsWalking.__name__
+                                 }
+
+Metrics = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+@dataclass
+class BatchInfo:
+    """Результаты пакета тренировок, разложенные по столбцам."""
+    training_type: np.ndarray
+    duration: np.ndarray
+    distance: np.ndarray
+    speed: np.ndarray
+    calories: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.duration)
+
+    def messages(self) -> Iterator[InfoMessage]:
+        """Построчно вернуть результаты в виде `InfoMessage`."""
+        for row in zip(self.training_type.tolist(),
+                       self.duration.tolist(),
+                       self.distance.tolist(),
+                       self.speed.tolist(),
+                       self.calories.tolist()
+                       ):
+            yield InfoMessage(*row)
+
+
+def _running_metrics(action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray
+                     ) -> Metrics:
+    """Посчитать дистанцию, скорость и калории для бега."""
+    distance = action * Running.LEN_STEP / Running.M_IN_KM
+    speed = distance / duration
+    calories = ((Running.CALORIES_MEAN_SPEED_MULTIPLIER * speed
+                + Running.CALORIES_MEAN_SPEED_SHIFT) * weight / Running.M_IN_KM
+                * (duration * Running.MIN_IN_H))
+    return distance, speed, calories
+
+
+def _walking_metrics(action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray,
+                     height: np.ndarray
+                     ) -> Metrics:
+    """Посчитать дистанцию, скорость и калории для спортивной ходьбы."""
+    distance = action * SportsWalking.LEN_STEP / SportsWalking.M_IN_KM
+    speed = distance / duration
+    calories = ((SportsWalking.CALORIES_WEIGHT_MULTIPLIER * weight
+                + ((speed * SportsWalking.KMH_IN_MSEC)**2
+                 / (height / SportsWalking.CM_IN_M))
+                 * SportsWalking.CALORIES_SPEED_HEIGHT_MULTIPLIER
+                * weight)
+                * (duration * SportsWalking.MIN_IN_H))
+    return distance, speed, calories
+
+
+def _swimming_metrics(action: np.ndarray,
+                      duration: np.ndarray,
+                      weight: np.ndarray,
+                      length_pool: np.ndarray,
+                      count_pool: np.ndarray
+                      ) -> Metrics:
+    """Посчитать дистанцию, скорость и калории для плавания."""
+    distance = action * Swimming.LEN_STEP / Swimming.M_IN_KM
+    speed = length_pool * count_pool / Swimming.M_IN_KM / duration
+    calories = ((speed
+                + Swimming.CALORIES_MEAN_SPEED_SHIFT)
+                * Swimming.CALORIES_WEIGHT_MULTIPLIER
+                * weight
+                * duration)
+    return distance, speed, calories
+
+
+def _column(values: Optional[Sequence[float]], size: int) -> np.ndarray:
+    """Привести столбец к float64; пустой столбец заполнить нулями."""
+    if values is None:
+        return np.zeros(size, dtype=np.float64)
+    column = np.asarray(values, dtype=np.float64)
+    if column.shape != (size,):
+        raise ValueError('Длины столбцов пакета не совпадают.')
+    return column
+
+
+def calculate_batch(workout_type: Sequence[str],
+                    action: Sequence[float],
+                    duration: Sequence[float],
+                    weight: Sequence[float],
+                    height: Optional[Sequence[float]] = None,
+                    length_pool: Optional[Sequence[float]] = None,
+                    count_pool: Optional[Sequence[float]] = None
+                    ) -> BatchInfo:
+    """Рассчитать результаты пакета тренировок за один проход.
+
+    Столбцы, не относящиеся к виду тренировки (например, `height`
+    для бега), игнорируются. Формулы повторяют методы классов
+    `Running`, `SportsWalking` и `Swimming` с тем же порядком операций,
+    поэтому результаты совпадают с построчным расчётом.
+    """
+    codes = np.asarray(workout_type)
+    size = len(codes)
+    action = _column(action, size)
+    duration = _column(duration, size)
+    weight = _column(weight, size)
+    height = _column(height, size)
+    length_pool = _column(length_pool, size)
+    count_pool = _column(count_pool, size)
+
+    unknown = ~np.isin(codes, list(WORKOUT_NAMES))
+    if unknown.any():
+        raise ValueError('Такого типа тренировки не существует.')
+
+    distance = np.empty(size, dtype=np.float64)
+    speed = np.empty(size, dtype=np.float64)
+    calories = np.empty(size, dtype=np.float64)
+    training_type = np.empty(size, dtype=object)
+
+    for code, name in WORKOUT_NAMES.items():
+        mask = codes == code
+        if not mask.any():
+            continue
+        args = (action[mask], duration[mask], weight[mask])
+        if code == 'RUN':
+            metrics = _running_metrics(*args)
+        elif code == 'WLK':
+            metrics = _walking_metrics(*args, height[mask])
+        else:
+            metrics = _swimming_metrics(*args,
+                                        length_pool[mask],
+                                        count_pool[mask])
+        distance[mask], speed[mask], calories[mask] = metrics
+        training_type[mask] = name
+
+    return BatchInfo(training_type, duration, distance, speed, calories)
+
+
+class PackageColumns:
+    """Пакеты тренировок, хранимые по столбцам.
+
+    Компактная замена списку объектов `Training`: каждый пакет занимает
+    по одному элементу в плотных массивах `array` вместо отдельного
+    объекта со своим `__dict__`.
+    """
+    __slots__ = ('workout_type', 'action', 'duration', 'weight',
+                 'height', 'length_pool', 'count_pool')
+
+    CODES: Tuple[str, ...] = tuple(WORKOUT_NAMES)
+
+    def __init__(self, packages: Iterable[Package] = ()) -> None:
+        self.workout_type = array('B')
+        self.action = array('d')
+        self.duration = array('d')
+        self.weight = array('d')
+        self.height = array('d')
+        self.length_pool = array('d')
+        self.count_pool = array('d')
+        self.extend(packages)
+
+    def __len__(self) -> int:
+        return len(self.workout_type)
+
+    def append(self, workout_type: str, data: Sequence[float]) -> None:
+        """Добавить пакет `(workout_type, data)`."""
+        if workout_type not in WORKOUT_NAMES:
+            raise ValueError('Такого типа тренировки не существует.')
+        action, duration, weight, *extra = data
+        height = extra[0] if workout_type == 'WLK' else 0
+        length_pool, count_pool = extra if workout_type == 'SWM' else (0, 0)
+        self.workout_type.append(self.CODES.index(workout_type))
+        self.action.append(action)
+        self.duration.append(duration)
+        self.weight.append(weight)
+        self.height.append(height)
+        self.length_pool.append(length_pool)
+        self.count_pool.append(count_pool)
+
+    def extend(self, packages: Iterable[Package]) -> None:
+        """Добавить пакеты из итерируемого объекта."""
+        for workout_type, data in packages:
+            self.append(workout_type, data)
+
+    def calculate(self) -> BatchInfo:
+        """Рассчитать результаты всех хранимых пакетов."""
+        codes = np.asarray(self.CODES)[np.frombuffer(self.workout_type,
+                                                     dtype=np.uint8)]
+        return calculate_batch(codes,
+                               np.frombuffer(self.action),
+                               np.frombuffer(self.duration),
+                               np.frombuffer(self.weight),
+                               np.frombuffer(self.height),
+                               np.frombuffer(self.length_pool),
+                               np.frombuffer(self.count_pool)
+                               )
@@ -0,0 +1,81 @@
+import argparse
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from batch import PackageColumns
+from homework import InfoMessage, read_package
+from stream import Package
+
+
+@dataclass
+class DictInfoMessage:
+    """`InfoMessage` без `__slots__` для сравнения."""
+    training_type: str
+    duration: float
+    distance: float
+    speed: float
+    calories: float
+
+
+def generate_packages(count: int, seed: int = 0) -> List[Package]:
+    """Сгенерировать случайные пакеты всех видов тренировок."""
+    rnd = random.Random(seed)
+    packages: List[Package] = []
+    for _ in range(count):
+        workout_type = rnd.choice(['SWM', 'RUN', 'WLK'])
+        data = [rnd.randint(100, 30000), rnd.uniform(0.1, 5),
+                rnd.uniform(40, 120)]
+        if workout_type == 'WLK':
+            data.append(rnd.uniform(140, 210))
+        elif workout_type == 'SWM':
+            data.extend([rnd.randint(10, 50), rnd.randint(1, 80)])
+        packages.append((workout_type, data))
+    return packages
+
+
+def bytes_per_record(build: Callable[[], object], count: int) -> float:
+    """Посчитать прирост памяти на одну запись при вызове `build`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def run(count: int) -> Dict[str, float]:
+    """Замерить память представлений тренировок и сообщений."""
+    packages = generate_packages(count)
+    infos = [read_package(*package).show_training_info()
+             for package in packages]
+    rows = [(info.training_type, info.duration, info.distance,
+             info.speed, info.calories) for info in infos]
+    return {
+        'training_objects': bytes_per_record(
+            lambda: [read_package(*package) for package in packages],
+            count),
+        'package_columns': bytes_per_record(
+            lambda: PackageColumns(packages), count),
+        'info_message_dict': bytes_per_record(
+            lambda: [DictInfoMessage(*row) for row in rows], count),
+        'info_message_slots': bytes_per_record(
+            lambda: [InfoMessage(*row) for row in rows], count),
+    }
+
+
+def main() -> None:
+    """Вывести замеры памяти в байтах на запись в формате JSON."""
+    parser = argparse.ArgumentParser(
+        description='Замер памяти на одну тренировку.')
+    parser.add_argument('--count', type=int, default=100000,
+                        help='число пакетов, по умолчанию 100000')
+    args = parser.parse_args()
+    print(json.dumps(run(args.count), indent=2))
+
+
+if __name__ == '__main__':
+    main()
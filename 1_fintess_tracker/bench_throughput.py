@@ -0,0 +1,110 @@
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from batch import PackageColumns
+from bench_memory import generate_packages
+from homework import format_messages, print_messages, read_package
+
+DEFAULT_TOLERANCE: float = 0.2
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Вернуть лучшее время из `repeat` запусков функции."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(count: int, repeat: int, seed: int) -> Dict[str, object]:
+    """Замерить пакеты в секунду для каждого этапа обработки.
+
+    Каждый этап замеряется на заранее подготовленных входных данных:
+    - `read_package.scalar` — создание объектов тренировок,
+      `read_package.columns` — сборка столбцового `PackageColumns`;
+    - `show_training_info.scalar` — расчёт на готовых объектах,
+      `show_training_info.columns` — векторный расчёт на готовых
+      столбцах;
+    - `get_message.scalar` — форматирование сообщений,
+      `print_messages.chunked` — форматирование и запись порциями
+      в буфер.
+    """
+    packages = generate_packages(count, seed)
+    trainings = [read_package(*package) for package in packages]
+    infos = [training.show_training_info() for training in trainings]
+    columns = PackageColumns(packages)
+
+    cases: Dict[str, Callable[[], object]] = {
+        'read_package.scalar':
+            lambda: [read_package(*package) for package in packages],
+        'read_package.columns': lambda: PackageColumns(packages),
+        'show_training_info.scalar':
+            lambda: [training.show_training_info()
+                     for training in trainings],
+        'show_training_info.columns': columns.calculate,
+        'get_message.scalar': lambda: list(format_messages(infos)),
+        'print_messages.chunked':
+            lambda: print_messages(infos, io.StringIO()),
+    }
+    results = {name: count / best_time(case, repeat)
+               for name, case in cases.items()}
+    return {
+        'python': platform.python_version(),
+        'count': count,
+        'repeat': repeat,
+        'seed': seed,
+        'packages_per_sec': results,
+    }
+
+
+def find_regressions(results: Dict[str, float],
+                     baseline: Dict[str, float],
+                     tolerance: float
+                     ) -> List[str]:
+    """Вернуть этапы, которые стали медленнее базовых более чем на допуск."""
+    return [name for name, value in results.items()
+            if name in baseline
+            and value < baseline[name] * (1 - tolerance)]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Вывести замеры в JSON и сравнить их с базовыми при наличии."""
+    parser = argparse.ArgumentParser(
+        description='Замер пропускной способности фитнес-трекера.')
+    parser.add_argument('--count', type=int, default=100000,
+                        help='число пакетов, по умолчанию 100000')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='число повторов, берётся лучший результат')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='зерно генератора пакетов')
+    parser.add_argument('--output', help='файл для результатов в JSON')
+    parser.add_argument('--baseline', help='файл с базовыми результатами')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='допустимое замедление, по умолчанию 0.2')
+    args = parser.parse_args(argv)
+    report = run(args.count, args.repeat, args.seed)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)['packages_per_sec']
+    regressions = find_regressions(report['packages_per_sec'], baseline,
+                                   args.tolerance)
+    for name in regressions:
+        print(f'Регрессия производительности: {name}', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
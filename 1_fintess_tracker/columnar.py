@@ -0,0 +1,145 @@
+import json
+from array import array
+import struct
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from batch import BatchInfo
+from homework import InfoMessage
+
+MAGIC: bytes = b'FTCOL\x00\x01\x00'
+HEADER = struct.Struct('<8sQI')
+ALIGNMENT: int = 8
+MAX_TRAINING_TYPES: int = 256
+COLUMNS: Tuple[str, ...] = ('duration', 'distance', 'speed', 'calories')
+CODE_DTYPE = np.dtype('u1')
+VALUE_DTYPE = np.dtype('<f8')
+
+
+def _padding(size: int) -> bytes:
+    """Вернуть байты выравнивания блока до границы `ALIGNMENT`."""
+    return b'\x00' * (-size % ALIGNMENT)
+
+
+def _write(path: str,
+           training_types: List[str],
+           codes: np.ndarray,
+           columns: Dict[str, np.ndarray]
+           ) -> int:
+    """Записать словарь видов тренировок, коды и столбцы в файл.
+
+    Формат файла: заголовок (сигнатура, число строк, длина словаря),
+    словарь видов тренировок в JSON, столбец кодов `uint8`
+    и столбцы `float64` в порядке `COLUMNS`. Каждый блок выровнен
+    по 8 байт, чтобы столбцы можно было отобразить в память.
+    """
+    if len(training_types) > MAX_TRAINING_TYPES:
+        raise ValueError('Слишком много видов тренировок для словаря.')
+    dictionary = json.dumps(training_types).encode('utf-8')
+    rows = len(codes)
+    with open(path, 'wb') as file:
+        header = HEADER.pack(MAGIC, rows, len(dictionary))
+        file.write(header + _padding(len(header)))
+        file.write(dictionary + _padding(len(dictionary)))
+        file.write(codes.astype(CODE_DTYPE, copy=False).tobytes())
+        file.write(_padding(rows))
+        for name in COLUMNS:
+            column = columns[name].astype(VALUE_DTYPE, copy=False)
+            file.write(column.tobytes())
+    return rows
+
+
+def write_messages(path: str, infos: Iterable[InfoMessage]) -> int:
+    """Записать сообщения о тренировках в столбцовый файл.
+
+    Возвращает число записанных строк.
+    """
+    training_types: Dict[str, int] = {}
+    codes = array('B')
+    columns = {name: array('d') for name in COLUMNS}
+    for info in infos:
+        code = training_types.setdefault(info.training_type,
+                                         len(training_types))
+        if code >= MAX_TRAINING_TYPES:
+            raise ValueError('Слишком много видов тренировок для словаря.')
+        codes.append(code)
+        for name, column in columns.items():
+            column.append(getattr(info, name))
+    return _write(path,
+                  list(training_types),
+                  np.frombuffer(codes, dtype=CODE_DTYPE),
+                  {name: np.frombuffer(column, dtype=np.float64)
+                   for name, column in columns.items()}
+                  )
+
+
+def write_batch(path: str, info: BatchInfo) -> int:
+    """Записать результаты пакетного расчёта в столбцовый файл."""
+    training_types, codes = np.unique(info.training_type.astype(str),
+                                      return_inverse=True)
+    return _write(path,
+                  training_types.tolist(),
+                  codes,
+                  {name: getattr(info, name) for name in COLUMNS}
+                  )
+
+
+@dataclass
+class ColumnarInfo:
+    """Результаты тренировок, отображённые из столбцового файла."""
+    training_types: Tuple[str, ...]
+    codes: np.ndarray
+    duration: np.ndarray
+    distance: np.ndarray
+    speed: np.ndarray
+    calories: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def training_type(self) -> np.ndarray:
+        """Раскодировать виды тренировок по словарю."""
+        return np.asarray(self.training_types, dtype=object)[self.codes]
+
+    def messages(self) -> Iterator[InfoMessage]:
+        """Построчно вернуть результаты в виде `InfoMessage`."""
+        for code, *values in zip(self.codes.tolist(),
+                                 self.duration.tolist(),
+                                 self.distance.tolist(),
+                                 self.speed.tolist(),
+                                 self.calories.tolist()
+                                 ):
+            yield InfoMessage(self.training_types[code], *values)
+
+
+def _map(path: str, dtype: np.dtype, offset: int, rows: int) -> np.ndarray:
+    """Отобразить столбец файла в память без копирования."""
+    if not rows:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                     shape=(rows,))
+
+
+def read_columns(path: str) -> ColumnarInfo:
+    """Открыть столбцовый файл, отобразив столбцы в память."""
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError('Файл не является столбцовым файлом тренировок.')
+        magic, rows, dictionary_size = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError('Файл не является столбцовым файлом тренировок.')
+        offset = HEADER.size + len(_padding(HEADER.size))
+        file.seek(offset)
+        training_types = tuple(json.loads(file.read(dictionary_size)))
+    offset += dictionary_size + len(_padding(dictionary_size))
+    codes = _map(path, CODE_DTYPE, offset, rows)
+    offset += rows + len(_padding(rows))
+    columns = []
+    for _ in COLUMNS:
+        columns.append(_map(path, VALUE_DTYPE, offset, rows))
+        offset += rows * VALUE_DTYPE.itemsize
+    return ColumnarInfo(training_types, codes, *columns)
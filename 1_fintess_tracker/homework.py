@@ -1,10 +1,18 @@
+import inspect
+import sys
 from dataclasses import dataclass
-from typing import List
+from itertools import islice
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional,
+                    TextIO, Tuple, Type)
+
+MESSAGES_CHUNK_SIZE: int = 1000
 
 
 @dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
@@ -57,6 +65,32 @@ class Training:
                            )
 
 
+WORKOUT_CLASSES: Dict[str, Tuple[Callable[..., Training], int]] = {}
+
+
+def register_workout(workout_type: str
+                     ) -> Callable[[Type[Training]], Type[Training]]:
+    """Зарегистрировать класс тренировки под кодом `workout_type`.
+
+    Число аргументов конструктора определяется один раз при регистрации,
+    поэтому `read_package` проверяет пакет простым сравнением длины.
+    """
+    def decorator(training_class: Type[Training]) -> Type[Training]:
+        if workout_type in WORKOUT_CLASSES:
+            raise ValueError(f'Тип тренировки {workout_type} '
+                             'уже зарегистрирован.')
+        parameters = inspect.signature(training_class).parameters.values()
+        if any(parameter.kind is not parameter.POSITIONAL_OR_KEYWORD
+               or parameter.default is not parameter.empty
+               for parameter in parameters):
+            raise TypeError('Конструктор тренировки должен принимать '
+                            'только обязательные позиционные аргументы.')
+        WORKOUT_CLASSES[workout_type] = (training_class, len(parameters))
+        return training_class
+    return decorator
+
+
+@register_workout('RUN')
 class Running(Training):
     """Тренировка: бег."""
     CALORIES_MEAN_SPEED_MULTIPLIER: int = 18
@@ -69,6 +103,7 @@ class Running(Training):
                 * (self.duration * self.MIN_IN_H))
 
 
+@register_workout('WLK')
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
     CALORIES_WEIGHT_MULTIPLIER: float = 0.035
@@ -95,6 +130,7 @@ class SportsWalking(Training):
                 * (self.duration * self.MIN_IN_H))
 
 
+@register_workout('SWM')
 class Swimming(Training):
     """Тренировка: плавание."""
     CALORIES_MEAN_SPEED_SHIFT: float = 1.1
@@ -124,11 +160,7 @@ class Swimming(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        get_mean_speed_swimming: float = (self.length_pool
-                                          * self.count_pool
-                                          / self.M_IN_KM
-                                          / self.duration)
-        return ((get_mean_speed_swimming
+        return ((self.get_mean_speed()
                 + self.CALORIES_MEAN_SPEED_SHIFT)
                 * self.CALORIES_WEIGHT_MULTIPLIER
                 * self.weight
@@ -137,14 +169,40 @@ class Swimming(Training):
 
 def read_package(workout_type: str, data: List[int]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    workout_classes: dict[str, type[Training]] = {'SWM': Swimming,
-                                                  'RUN': Running,
-                                                  'WLK': SportsWalking
-                                                  }
-    if workout_type in workout_classes.keys():
-        type_of_training = workout_classes[workout_type](*data)
-        return type_of_training
-    raise ValueError('Такого типа тренировки не существует.')
+    if workout_type not in WORKOUT_CLASSES:
+        raise ValueError('Такого типа тренировки не существует.')
+    training_class, arity = WORKOUT_CLASSES[workout_type]
+    if len(data) != arity:
+        raise ValueError(f'Пакет {workout_type} должен содержать '
+                         f'{arity} значений.')
+    return training_class(*data)
+
+
+def format_messages(infos: Iterable[InfoMessage]) -> Iterator[str]:
+    """Лениво форматировать сообщения по мере их потребления."""
+    for info in infos:
+        yield info.get_message()
+
+
+def print_messages(infos: Iterable[InfoMessage],
+                   file: Optional[TextIO] = None,
+                   chunk_size: int = MESSAGES_CHUNK_SIZE
+                   ) -> int:
+    """Вывести сообщения о тренировках крупными блоками.
+
+    Сообщения форматируются только при записи и выводятся
+    по `chunk_size` штук одним вызовом `write` вместо `print`
+    на каждую строку. Возвращает число выведенных сообщений.
+    """
+    file = file or sys.stdout
+    messages = format_messages(infos)
+    count = 0
+    while True:
+        chunk = list(islice(messages, chunk_size))
+        if not chunk:
+            return count
+        file.write('\n'.join(chunk) + '\n')
+        count += len(chunk)
 
 
 def main(training: Training) -> None:
@@ -160,6 +218,5 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    print_messages(read_package(workout_type, data).show_training_info()
+                   for workout_type, data in packages)
@@ -0,0 +1,77 @@
+import argparse
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from homework import InfoMessage, print_messages, read_package
+from stream import FORMATS, Package, parse_packages, read_lines
+
+DEFAULT_CHUNK_SIZE: int = 1000
+
+
+def _process_chunk(chunk: Sequence[Package]) -> List[InfoMessage]:
+    """Посчитать результаты тренировок одного шарда в воркере."""
+    return [read_package(workout_type, data).show_training_info()
+            for workout_type, data in chunk]
+
+
+def _chunks(packages: Iterable[Package],
+            chunk_size: int
+            ) -> Iterator[List[Package]]:
+    """Нарезать поток пакетов на шарды по `chunk_size` штук."""
+    iterator = iter(packages)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_parallel(packages: Iterable[Package],
+                     workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE
+                     ) -> Iterator[InfoMessage]:
+    """Посчитать результаты тренировок в пуле процессов.
+
+    Поток пакетов режется на шарды по `chunk_size` штук, шарды
+    обрабатываются в `workers` процессах (по умолчанию по числу ядер),
+    а результаты отдаются в исходном порядке пакетов. В обработке
+    одновременно не больше `2 * workers` шардов: следующий шард
+    читается из потока, только когда отдан результат самого старого,
+    поэтому память не растёт с размером входа.
+    """
+    if chunk_size < 1:
+        raise ValueError('Размер шарда должен быть положительным.')
+    workers = workers or cpu_count()
+    in_flight = 2 * workers
+    with Pool(workers) as pool:
+        pending = deque()
+        for chunk in _chunks(packages, chunk_size):
+            pending.append(pool.apply_async(_process_chunk, (chunk,)))
+            if len(pending) >= in_flight:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+def main() -> None:
+    """Вывести результаты тренировок, посчитанные в пуле процессов."""
+    parser = argparse.ArgumentParser(
+        description='Параллельная обработка пакетов от блока датчиков.')
+    parser.add_argument('path', nargs='?', default='-',
+                        help='файл с пакетами, по умолчанию stdin')
+    parser.add_argument('--format', choices=FORMATS, default='jsonl',
+                        help='формат пакетов, по умолчанию jsonl')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='число процессов, по умолчанию по числу ядер')
+    parser.add_argument('--chunk-size', type=int,
+                        default=DEFAULT_CHUNK_SIZE,
+                        help='число пакетов в одном шарде')
+    args = parser.parse_args()
+    packages = parse_packages(read_lines(args.path), args.format)
+    print_messages(process_parallel(packages, args.workers, args.chunk_size))
+
+
+if __name__ == '__main__':
+    main()
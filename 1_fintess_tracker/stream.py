@@ -0,0 +1,77 @@
+import argparse
+import csv
+import json
+import sys
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from homework import InfoMessage, print_messages, read_package
+
+FORMATS = ('jsonl', 'csv')
+
+Number = Union[int, float]
+Package = Tuple[str, List[Number]]
+
+
+def _to_number(value: str) -> Number:
+    """Преобразовать строковое поле CSV в число."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def read_lines(path: str) -> Iterator[str]:
+    """Лениво построчно прочитать файл; `-` означает stdin."""
+    if path == '-':
+        yield from sys.stdin
+        return
+    with open(path, encoding='utf-8') as file:
+        yield from file
+
+
+def parse_packages(lines: Iterable[str],
+                   fmt: str = 'jsonl'
+                   ) -> Iterator[Package]:
+    """Разобрать строки в пакеты вида `(workout_type, data)`.
+
+    Строка JSONL: `["SWM", [720, 1, 80, 25, 40]]`.
+    Строка CSV: `SWM,720,1,80,25,40`.
+    Пустые строки пропускаются.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f'Неизвестный формат пакетов: {fmt}.')
+    lines = (line for line in lines if line.strip())
+    if fmt == 'csv':
+        for workout_type, *data in csv.reader(lines):
+            yield workout_type, [_to_number(value) for value in data]
+        return
+    for line in lines:
+        workout_type, data = json.loads(line)
+        yield workout_type, data
+
+
+def process_packages(packages: Iterable[Package]) -> Iterator[InfoMessage]:
+    """Посчитать результаты тренировок по мере поступления пакетов."""
+    for workout_type, data in packages:
+        yield read_package(workout_type, data).show_training_info()
+
+
+def stream_info(path: str, fmt: str = 'jsonl') -> Iterator[InfoMessage]:
+    """Лениво посчитать результаты тренировок из файла или stdin."""
+    return process_packages(parse_packages(read_lines(path), fmt))
+
+
+def main() -> None:
+    """Вывести результаты тренировок из потока пакетов."""
+    parser = argparse.ArgumentParser(
+        description='Потоковая обработка пакетов от блока датчиков.')
+    parser.add_argument('path', nargs='?', default='-',
+                        help='файл с пакетами, по умолчанию stdin')
+    parser.add_argument('--format', choices=FORMATS, default='jsonl',
+                        help='формат пакетов, по умолчанию jsonl')
+    args = parser.parse_args()
+    print_messages(stream_info(args.path, args.format))
+
+
+if __name__ == '__main__':
+    main()
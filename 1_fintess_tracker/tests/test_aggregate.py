@@ -0,0 +1,54 @@
+from datetime import date
+
+import pytest
+
+import aggregate
+import homework
+
+PACKAGES = [
+    ('alice', 'SWM', [720, 1, 80, 25, 40], date(2023, 2, 6)),
+    ('alice', 'RUN', [15000, 1, 75], date(2023, 2, 8)),
+    ('alice', 'WLK', [9000, 1, 75, 180], date(2023, 2, 14)),
+    ('bob', 'RUN', [1206, 12, 6], date(2023, 2, 14)),
+]
+
+
+def fill(aggregator):
+    for athlete_id, workout_type, data, day in PACKAGES:
+        aggregator.add_package(athlete_id, workout_type, data, day)
+
+
+def test_totals():
+    aggregator = aggregate.TrainingAggregator()
+    fill(aggregator)
+    infos = [homework.read_package(workout_type, data).show_training_info()
+             for _, workout_type, data, _ in PACKAGES[:3]]
+    totals = aggregator.totals('alice')
+    assert totals.total.trainings == 3
+    assert totals.total.distance == pytest.approx(
+        sum(info.distance for info in infos))
+    assert totals.total.calories == pytest.approx(
+        sum(info.calories for info in infos))
+    assert list(totals.weeks) == ['2023-W06', '2023-W07']
+    assert totals.weeks['2023-W06'].trainings == 2
+    assert totals.weekly_average()['calories'] == pytest.approx(
+        totals.total.calories / 2)
+
+
+def test_totals_unknown_athlete():
+    aggregator = aggregate.TrainingAggregator()
+    assert aggregator.totals('nobody').total.trainings == 0
+    assert aggregator.totals('nobody').weekly_average()['distance'] == 0.0
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / 'state.json')
+    aggregator = aggregate.TrainingAggregator()
+    fill(aggregator)
+    aggregator.save(path)
+    restored = aggregate.TrainingAggregator.load(path)
+    assert restored.athletes == aggregator.athletes, (
+        'Состояние должно восстанавливаться из файла без потерь.'
+    )
+    restored.add_package('bob', 'RUN', [15000, 1, 75], date(2023, 2, 15))
+    assert restored.totals('bob').total.trainings == 2
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+import batch
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+]
+
+
+def random_packages(count):
+    rnd = random.Random(42)
+    packages = []
+    for _ in range(count):
+        workout_type = rnd.choice(['SWM', 'RUN', 'WLK'])
+        data = [rnd.randint(100, 30000), rnd.uniform(0.1, 5),
+                rnd.uniform(40, 120)]
+        if workout_type == 'WLK':
+            data.append(rnd.uniform(140, 210))
+        elif workout_type == 'SWM':
+            data.extend([rnd.randint(10, 50), rnd.randint(1, 80)])
+        packages.append((workout_type, data))
+    return packages
+
+
+def to_columns(packages):
+    columns = {name: [] for name in (
+        'workout_type', 'action', 'duration', 'weight',
+        'height', 'length_pool', 'count_pool')}
+    for workout_type, data in packages:
+        columns['workout_type'].append(workout_type)
+        columns['action'].append(data[0])
+        columns['duration'].append(data[1])
+        columns['weight'].append(data[2])
+        columns['height'].append(data[3] if workout_type == 'WLK' else 0)
+        columns['length_pool'].append(
+            data[3] if workout_type == 'SWM' else 0)
+        columns['count_pool'].append(
+            data[4] if workout_type == 'SWM' else 0)
+    return columns
+
+
+@pytest.mark.parametrize('packages', [PACKAGES, random_packages(500)])
+def test_calculate_batch_matches_scalar(packages):
+    result = batch.calculate_batch(**to_columns(packages))
+    expected = [homework.read_package(*package).show_training_info()
+                for package in packages]
+    assert len(result) == len(expected)
+    assert list(result.messages()) == expected, (
+        'Пакетный расчёт должен совпадать с расчётом по объектам.'
+    )
+
+
+def test_calculate_batch_unknown_workout():
+    with pytest.raises(ValueError):
+        batch.calculate_batch(['XXX'], [1], [1], [1])
+
+
+def test_calculate_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        batch.calculate_batch(['RUN', 'RUN'], [1, 2], [1], [1, 2])
+
+
+def test_package_columns_matches_scalar():
+    packages = random_packages(200)
+    columns = batch.PackageColumns(packages)
+    expected = [homework.read_package(*package).show_training_info()
+                for package in packages]
+    assert len(columns) == len(packages)
+    assert list(columns.calculate().messages()) == expected
+
+
+def test_package_columns_unknown_workout():
+    with pytest.raises(ValueError):
+        batch.PackageColumns([('XXX', [1, 1, 1])])
@@ -0,0 +1,20 @@
+import bench_throughput
+
+CASES = [
+    'read_package.scalar', 'read_package.columns',
+    'show_training_info.scalar', 'show_training_info.columns',
+    'get_message.scalar', 'print_messages.chunked',
+]
+
+
+def test_run_reports_every_stage():
+    report = bench_throughput.run(count=30, repeat=1, seed=1)
+    results = report['packages_per_sec']
+    assert sorted(results) == sorted(CASES)
+    assert all(value > 0 for value in results.values())
+
+
+def test_find_regressions():
+    baseline = {'a': 100.0, 'b': 100.0, 'c': 100.0}
+    results = {'a': 95.0, 'b': 70.0, 'd': 1.0}
+    assert bench_throughput.find_regressions(results, baseline, 0.2) == ['b']
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import batch
+import columnar
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+]
+
+
+def infos():
+    return [homework.read_package(*package).show_training_info()
+            for package in PACKAGES]
+
+
+def test_write_and_read_messages(tmp_path):
+    path = str(tmp_path / 'results.ftc')
+    assert columnar.write_messages(path, iter(infos())) == len(PACKAGES)
+    result = columnar.read_columns(path)
+    assert len(result) == len(PACKAGES)
+    assert isinstance(result.calories, np.memmap), (
+        'Столбцы должны отображаться в память без копирования.'
+    )
+    assert list(result.messages()) == infos()
+    assert result.training_type.tolist() == [
+        info.training_type for info in infos()]
+
+
+def test_write_batch(tmp_path):
+    path = str(tmp_path / 'results.ftc')
+    columns = batch.PackageColumns(PACKAGES)
+    columnar.write_batch(path, columns.calculate())
+    assert list(columnar.read_columns(path).messages()) == infos()
+
+
+def test_read_empty(tmp_path):
+    path = str(tmp_path / 'results.ftc')
+    columnar.write_messages(path, [])
+    result = columnar.read_columns(path)
+    assert len(result) == 0
+    assert list(result.messages()) == []
+
+
+def test_read_invalid_file(tmp_path):
+    path = tmp_path / 'results.txt'
+    path.write_bytes(b'not a columnar file at all')
+    with pytest.raises(ValueError):
+        columnar.read_columns(str(path))
@@ -419,3 +419,82 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_Training_metrics_follow_mutation():
+    training = homework.Running(15000, 1, 75)
+    speed = training.get_mean_speed()
+    calories = training.get_spent_calories()
+    training.duration = 2
+    assert training.get_mean_speed() == speed / 2, (
+        'После изменения данных тренировки показатели '
+        'должны пересчитываться.'
+    )
+    assert training.get_spent_calories() != calories
+    assert training.get_spent_calories() == (
+        homework.Running(15000, 2, 75).get_spent_calories()
+    )
+
+
+def test_print_messages_in_chunks():
+    class File:
+        def __init__(self):
+            self.writes = []
+
+        def write(self, text):
+            self.writes.append(text)
+
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+    ] * 3
+    infos = [homework.read_package(*package).show_training_info()
+             for package in packages]
+    file = File()
+    count = homework.print_messages(iter(infos), file, chunk_size=4)
+    assert count == len(infos)
+    assert len(file.writes) == 3, (
+        'Сообщения должны выводиться блоками по `chunk_size` штук.'
+    )
+    assert ''.join(file.writes).splitlines() == [
+        info.get_message() for info in infos]
+
+
+def test_print_messages_to_stdout():
+    info = homework.read_package('RUN', [1206, 12, 6]).show_training_info()
+    with Capturing() as output:
+        homework.print_messages([info])
+    assert output == [info.get_message()]
+
+
+def test_register_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_CLASSES',
+                        dict(homework.WORKOUT_CLASSES))
+
+    @homework.register_workout('CYC')
+    class Cycling(homework.Running):
+        pass
+
+    result = homework.read_package('CYC', [15000, 1, 75])
+    assert isinstance(result, Cycling), (
+        'Функция `read_package` должна создавать '
+        'зарегистрированные виды тренировок.'
+    )
+    with pytest.raises(ValueError):
+        homework.register_workout('CYC')(homework.Running)
+
+
+@pytest.mark.parametrize('input_data', [
+    ('RUN', [15000, 1]),
+    ('SWM', [720, 1, 80, 25]),
+    ('WLK', [9000, 1, 75, 180, 1]),
+])
+def test_read_package_wrong_arity(input_data):
+    with pytest.raises(ValueError):
+        homework.read_package(*input_data)
+
+
+def test_read_package_unknown_workout():
+    with pytest.raises(ValueError):
+        homework.read_package('XXX', [1, 1, 1])
@@ -0,0 +1,50 @@
+import pytest
+
+import homework
+import parallel
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+] * 7
+
+
+@pytest.mark.parametrize('workers, chunk_size', [
+    (1, 1000),
+    (2, 1),
+    (3, 4),
+])
+def test_process_parallel_keeps_order(workers, chunk_size):
+    result = list(parallel.process_parallel(
+        iter(PACKAGES), workers, chunk_size))
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    assert result == expected, (
+        'Результаты параллельной обработки должны идти '
+        'в порядке исходных пакетов.'
+    )
+
+
+def test_process_parallel_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(parallel.process_parallel(PACKAGES, 1, 0))
+
+
+def test_process_parallel_reads_input_lazily():
+    read = []
+
+    def packages():
+        for package in PACKAGES:
+            read.append(package)
+            yield package
+
+    results = parallel.process_parallel(packages(), 2, 1)
+    next(results)
+    assert len(read) <= 4, (
+        'Параллельная обработка должна читать пакеты по мере '
+        'отдачи результатов, а не весь поток сразу.'
+    )
+    results.close()
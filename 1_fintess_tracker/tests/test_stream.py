@@ -0,0 +1,57 @@
+import itertools
+
+import pytest
+
+import homework
+import stream
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1.5, 75, 180]),
+]
+JSONL_LINES = [
+    '["SWM", [720, 1, 80, 25, 40]]\n',
+    '\n',
+    '["RUN", [15000, 1, 75]]\n',
+    '["WLK", [9000, 1.5, 75, 180]]\n',
+]
+CSV_LINES = [
+    'SWM,720,1,80,25,40\n',
+    'RUN,15000,1,75\n',
+    '\n',
+    'WLK,9000,1.5,75,180\n',
+]
+
+
+@pytest.mark.parametrize('lines, fmt', [
+    (JSONL_LINES, 'jsonl'),
+    (CSV_LINES, 'csv'),
+])
+def test_parse_packages(lines, fmt):
+    result = list(stream.parse_packages(lines, fmt))
+    assert result == PACKAGES, (
+        'Функция `parse_packages` должна возвращать пакеты '
+        'вида `(workout_type, data)`.'
+    )
+
+
+def test_parse_packages_unknown_format():
+    with pytest.raises(ValueError):
+        list(stream.parse_packages(JSONL_LINES, 'xml'))
+
+
+def test_process_packages_is_lazy():
+    packages = itertools.cycle(PACKAGES)
+    result = stream.process_packages(packages)
+    first = next(result)
+    assert first == homework.read_package(*PACKAGES[0]).show_training_info()
+
+
+def test_stream_info_from_file(tmp_path):
+    path = tmp_path / 'packages.csv'
+    path.write_text(''.join(CSV_LINES), encoding='utf-8')
+    result = list(stream.stream_info(str(path), 'csv'))
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    assert result == expected
@@ -0,0 +1,51 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def get_cache():
+    return caches[settings.POSTS_CACHE_ALIAS]
+
+
+def version_key(section):
+    return f'posts:version:{section}'
+
+
+def new_version():
+    """Версия из текущего времени не совпадёт со старыми, даже если
+    счётчик вытеснили из кеша.
+    """
+    return time.time_ns()
+
+
+def get_version(section):
+    cache = get_cache()
+    key = version_key(section)
+    cache.add(key, new_version(), None)
+    return cache.get(key)
+
+
+def invalidate(*sections):
+    """Меняет версии разделов: их фрагменты больше не читаются."""
+    cache = get_cache()
+    for section in sections:
+        try:
+            cache.incr(version_key(section))
+        except ValueError:
+            cache.set(version_key(section), new_version(), None)
+
+
+def fragment_key(request, section):
+    """Ключ фрагмента страницы: версия раздела и параметры страницы."""
+    page = '|'.join(
+        request.GET.get(name, '') for name in ('page', 'after', 'before')
+    )
+    return f'{get_version(section)}:{page}'
+
+
+def post_sections(*group_ids):
+    """Разделы, на страницах которых виден пост из этих групп."""
+    return ['index'] + [
+        f'group:{group_id}' for group_id in set(group_ids) if group_id
+    ]
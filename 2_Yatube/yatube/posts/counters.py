@@ -0,0 +1,56 @@
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import Comment, Follow, Post, User, UserCounters
+
+
+def change_user(user_id, **deltas):
+    """Меняет счётчики пользователя одним UPDATE, без чтения и COUNT.
+
+    Уменьшение не опускает счётчик ниже нуля и пропускается, если
+    строки счётчиков уже нет: например, при каскадном удалении
+    пользователя вместе с его постами и подписками.
+    """
+    changes = {
+        field: Greatest(F(field) + delta, 0)
+        for field, delta in deltas.items()
+    }
+    counters = UserCounters.objects.filter(user_id=user_id)
+    if counters.update(**changes) or min(deltas.values()) < 0:
+        return
+    UserCounters.objects.get_or_create(user_id=user_id)
+    counters.update(**changes)
+
+
+def change_post(post_id, delta):
+    Post.objects.filter(pk=post_id).update(
+        comments_count=Greatest(F('comments_count') + delta, 0)
+    )
+
+
+def count_of(model, field):
+    """Подзапрос числа записей модели, ссылающихся на внешний объект."""
+    return Coalesce(Subquery(
+        model.objects.filter(
+            **{field: OuterRef('pk')}
+        ).order_by().values(field).annotate(
+            total=Count('pk')
+        ).values('total')
+    ), 0)
+
+
+def rebuild():
+    """Пересчитывает все счётчики по данным таблиц."""
+    missing = User.objects.filter(counters__isnull=True)
+    UserCounters.objects.bulk_create(
+        UserCounters(user_id=user_id)
+        for user_id in missing.values_list('pk', flat=True)
+    )
+    UserCounters.objects.update(
+        posts_count=count_of(Post, 'author'),
+        followers_count=count_of(Follow, 'author'),
+        following_count=count_of(Follow, 'user'),
+    )
+    Post.objects.update(
+        comments_count=count_of(Comment, 'post')
+    )
@@ -0,0 +1,134 @@
+from heapq import merge
+
+from django.conf import settings
+from django.db.models import OuterRef, Subquery
+
+from .models import FeedEntry, Follow, Post, UserCounters
+
+
+def is_popular(author):
+    """Посты автора с большим числом подписчиков не рассылаются по лентам,
+    а подмешиваются при чтении ленты.
+    """
+    return UserCounters.objects.filter(
+        user=author, followers_count__gt=settings.FEED_PUSH_LIMIT
+    ).exists()
+
+
+def popular_authors(user):
+    return UserCounters.objects.filter(
+        user__following__user=user,
+        followers_count__gt=settings.FEED_PUSH_LIMIT,
+    ).values_list('user_id', flat=True)
+
+
+def trim(users):
+    """Удаляет из лент пользователей записи старше FEED_SIZE последних.
+
+    Лента обрезается при рассылке одним DELETE для всех пользователей,
+    чтобы чтение ленты ничего не удаляло.
+    """
+    cutoff = FeedEntry.objects.filter(
+        user=OuterRef('user')
+    ).values('pub_date')[settings.FEED_SIZE - 1:settings.FEED_SIZE]
+    FeedEntry.objects.filter(
+        user__in=users, pub_date__lt=Subquery(cutoff)
+    ).delete()
+
+
+def push_post(post):
+    """Добавляет новый пост в ленты подписчиков автора."""
+    if is_popular(post.author):
+        return
+    followers = Follow.objects.filter(
+        author=post.author
+    ).values_list('user_id', flat=True)
+    FeedEntry.objects.bulk_create(
+        (FeedEntry(user_id=user_id, post=post, pub_date=post.pub_date)
+         for user_id in followers.iterator()),
+        batch_size=settings.FEED_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    trim(followers)
+
+
+def add_author(follow):
+    """Добавляет в ленту подписчика последние посты автора."""
+    if is_popular(follow.author):
+        return
+    posts = follow.author.posts.order_by(
+        '-pub_date', '-id'
+    ).values_list('id', 'pub_date')[:settings.FEED_SIZE]
+    FeedEntry.objects.bulk_create(
+        (FeedEntry(user_id=follow.user_id, post_id=post_id, pub_date=pub_date)
+         for post_id, pub_date in posts),
+        batch_size=settings.FEED_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    trim([follow.user_id])
+
+
+def backfill_author(author_id):
+    """Рассылает последние посты автора по лентам всех его подписчиков.
+
+    Нужна, когда автор перестаёт быть популярным: его посты больше не
+    подмешиваются при чтении, а написанные за время популярности или
+    пропущенные при подписке не были разосланы.
+    """
+    posts = list(Post.objects.filter(
+        author_id=author_id
+    ).order_by('-pub_date', '-id').values_list(
+        'id', 'pub_date'
+    )[:settings.FEED_SIZE])
+    followers = Follow.objects.filter(
+        author_id=author_id
+    ).values_list('user_id', flat=True)
+    FeedEntry.objects.bulk_create(
+        (FeedEntry(user_id=user_id, post_id=post_id, pub_date=pub_date)
+         for user_id in followers.iterator()
+         for post_id, pub_date in posts),
+        batch_size=settings.FEED_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    trim(followers)
+
+
+def remove_author(follow):
+    """Убирает из ленты подписчика посты автора.
+
+    Если после отписки автор перестал быть популярным, его посты
+    рассылаются по лентам оставшихся подписчиков. Счётчик подписчиков
+    к этому моменту уже уменьшен обработчиком count_deleted_follow.
+    """
+    FeedEntry.objects.filter(
+        user_id=follow.user_id, post__author_id=follow.author_id
+    ).delete()
+    if UserCounters.objects.filter(
+        user_id=follow.author_id,
+        followers_count=settings.FEED_PUSH_LIMIT,
+    ).exists():
+        backfill_author(follow.author_id)
+
+
+def get_feed(user):
+    """Возвращает id постов ленты пользователя от новых к старым.
+
+    Разосланные записи читаются из ленты, посты популярных авторов
+    подтягиваются отдельным запросом; лента ограничена FEED_SIZE
+    постами.
+    """
+    entries = list(
+        FeedEntry.objects.filter(user=user).values_list(
+            'pub_date', 'post_id'
+        )[:settings.FEED_SIZE]
+    )
+    pulled = Post.objects.filter(
+        author_id__in=list(popular_authors(user))
+    ).order_by('-pub_date', '-id').values_list(
+        'pub_date', 'id'
+    )[:settings.FEED_SIZE]
+    post_ids = []
+    for _, post_id in merge(entries, pulled, reverse=True):
+        if not post_ids or post_ids[-1] != post_id:
+            post_ids.append(post_id)
+    return post_ids[:settings.FEED_SIZE]
@@ -0,0 +1,56 @@
+from .models import Follow, UserCounters
+
+SESSION_KEY = 'following_ids'
+
+
+class FollowResolver:
+    """Подписки пользователя для ответа «подписан ли он на автора».
+
+    id авторов загружаются один раз за запрос и хранятся в сессии
+    вместе с версией подписок из счётчиков пользователя. Версия лежит
+    в базе, поэтому её изменение видят все воркеры, и при следующем
+    запросе список перечитывается.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self._ids = None
+
+    @property
+    def ids(self):
+        if self._ids is None:
+            self._ids = self.load()
+        return self._ids
+
+    def load(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return frozenset()
+        version = UserCounters.objects.filter(
+            user=user
+        ).values_list('follows_version', flat=True).first()
+        stored = self.request.session.get(SESSION_KEY)
+        if stored and stored['user'] == user.pk and (
+                stored['version'] == version):
+            return frozenset(stored['ids'])
+        ids = list(Follow.objects.filter(
+            user=user
+        ).values_list('author_id', flat=True))
+        self.request.session[SESSION_KEY] = {
+            'user': user.pk, 'version': version, 'ids': ids
+        }
+        return frozenset(ids)
+
+    def is_following(self, author):
+        return author.pk in self.ids
+
+
+class FollowResolverMiddleware:
+    """Добавляет request.follows с подписками текущего пользователя."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.follows = FollowResolver(request)
+        return self.get_response(request)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from posts import counters
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает счётчики постов, подписок и комментариев'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            counters.rebuild()
+        self.stdout.write(self.style.SUCCESS('Счётчики пересчитаны'))
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.16 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0016_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usercounters',
+            name='follows_version',
+            field=models.PositiveIntegerField(default=0, help_text='Растёт при каждом изменении подписок пользователя', verbose_name='Версия подписок'),
+        ),
+    ]
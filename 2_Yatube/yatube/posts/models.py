@@ -2,7 +2,7 @@ from core.models import CreatedModel
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 
 User = get_user_model()
 
@@ -30,7 +30,24 @@ class Group(models.Model):
         return self.title
 
 
-class Post(models.Model):
+class CountedModel(models.Model):
+    """Модель, от записей которой зависят счётчики.
+
+    Сохранение выполняется в одной транзакции с обработчиками
+    post_save, которые меняют счётчики, из какого бы места ни шла
+    запись. Удаление Django и так выполняет в транзакции вместе
+    с обработчиками post_delete.
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class Post(CountedModel):
     text = models.TextField(
         verbose_name='Текст поста',
         help_text='Введите текст поста'
@@ -62,6 +79,12 @@ class Post(models.Model):
         verbose_name='Картинка',
         help_text='Укажите картинку, которую хотите загрузить'
     )
+    comments_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Комментариев',
+        help_text='Число комментариев к посту',
+    )
 
     class Meta:
         ordering = ('-pub_date',)
@@ -73,7 +96,7 @@ class Post(models.Model):
         return self.text[:settings.POST_NUMBER]
 
 
-class Comment(CreatedModel):
+class Comment(CreatedModel, CountedModel):
     post = models.ForeignKey(
         Post,
         on_delete=models.CASCADE,
@@ -100,7 +123,7 @@ class Comment(CreatedModel):
         return self.text
 
 
-class Follow(models.Model):
+class Follow(CountedModel):
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -129,3 +152,76 @@ class Follow(models.Model):
                 check=~models.Q(user=models.F('author')),
             ),
         ]
+
+
+class FeedEntry(models.Model):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='feed',
+        verbose_name='Подписчик',
+        help_text='Пользователь, в ленту которого попал пост',
+    )
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='feed_entries',
+        verbose_name='Пост',
+        help_text='Пост автора, на которого подписан пользователь',
+    )
+    pub_date = models.DateTimeField(
+        verbose_name='Дата публикации',
+        help_text='Дата публикации поста',
+    )
+
+    class Meta:
+        ordering = ('-pub_date', '-post_id')
+        verbose_name = 'Запись ленты'
+        verbose_name_plural = 'Записи ленты'
+        constraints = [
+            models.UniqueConstraint(
+                name='unique_feed_post',
+                fields=['user', 'post'],
+            ),
+        ]
+        indexes = [
+            models.Index(
+                name='feed_user_pub_date',
+                fields=['user', '-pub_date'],
+            ),
+        ]
+
+
+class UserCounters(models.Model):
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='counters',
+        verbose_name='Пользователь',
+        help_text='Пользователь, для которого ведутся счётчики',
+    )
+    posts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Постов',
+        help_text='Число постов пользователя',
+    )
+    followers_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Подписчиков',
+        help_text='Число подписчиков пользователя',
+    )
+    following_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Подписок',
+        help_text='Число авторов, на которых подписан пользователь',
+    )
+    follows_version = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Версия подписок',
+        help_text='Растёт при каждом изменении подписок пользователя',
+    )
+
+    class Meta:
+        verbose_name = 'Счётчики пользователя'
+        verbose_name_plural = 'Счётчики пользователей'
@@ -0,0 +1,93 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import caching, counters, feed
+from .models import Comment, Follow, Post, User, UserCounters
+
+
+@receiver(post_save, sender=User)
+def create_counters(sender, instance, created, **kwargs):
+    if created:
+        UserCounters.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=Post)
+def count_new_post(sender, instance, created, **kwargs):
+    if created:
+        counters.change_user(instance.author_id, posts_count=1)
+
+
+@receiver(post_delete, sender=Post)
+def count_deleted_post(sender, instance, **kwargs):
+    counters.change_user(instance.author_id, posts_count=-1)
+
+
+@receiver(post_save, sender=Follow)
+def count_new_follow(sender, instance, created, **kwargs):
+    if created:
+        with transaction.atomic():
+            counters.change_user(instance.author_id, followers_count=1)
+            counters.change_user(instance.user_id, following_count=1,
+                                 follows_version=1)
+
+
+@receiver(post_delete, sender=Follow)
+def count_deleted_follow(sender, instance, **kwargs):
+    with transaction.atomic():
+        counters.change_user(instance.author_id, followers_count=-1)
+        counters.change_user(instance.user_id, following_count=-1,
+                             follows_version=1)
+
+
+@receiver(post_save, sender=Comment)
+def count_new_comment(sender, instance, created, **kwargs):
+    if created:
+        counters.change_post(instance.post_id, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def count_deleted_comment(sender, instance, **kwargs):
+    counters.change_post(instance.post_id, -1)
+
+
+@receiver(post_save, sender=Post)
+def push_to_feeds(sender, instance, created, **kwargs):
+    if created:
+        feed.push_post(instance)
+
+
+@receiver(post_save, sender=Follow)
+def fill_feed(sender, instance, created, **kwargs):
+    if created:
+        feed.add_author(instance)
+
+
+@receiver(post_delete, sender=Follow)
+def clean_feed(sender, instance, **kwargs):
+    feed.remove_author(instance)
+
+
+@receiver(pre_save, sender=Post)
+def remember_group(sender, instance, **kwargs):
+    instance.previous_group_id = instance.pk and sender.objects.filter(
+        pk=instance.pk
+    ).values_list('group_id', flat=True).first()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_pages(sender, instance, **kwargs):
+    caching.invalidate(*caching.post_sections(
+        instance.group_id, getattr(instance, 'previous_group_id', None)
+    ))
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_pages(sender, instance, **kwargs):
+    group_ids = Post.objects.filter(
+        pk=instance.post_id
+    ).values_list('group_id', flat=True)
+    if group_ids:
+        caching.invalidate(*caching.post_sections(*group_ids))
@@ -0,0 +1,107 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .. import counters
+from ..models import Comment, Follow, Post, User, UserCounters
+
+
+class CountersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='reader')
+        cls.author = User.objects.create_user(username='author')
+
+    def counters(self, user):
+        return UserCounters.objects.get(user=user)
+
+    def test_counters_follow_changes(self):
+        """Счётчики меняются при создании и удалении записей."""
+        post = Post.objects.create(author=self.author, text='Пост')
+        follow = Follow.objects.create(user=self.user, author=self.author)
+        comment = Comment.objects.create(
+            post=post, author=self.user, text='Коммент'
+        )
+        self.assertEqual(self.counters(self.author).posts_count, 1)
+        self.assertEqual(self.counters(self.author).followers_count, 1)
+        self.assertEqual(self.counters(self.user).following_count, 1)
+        post.refresh_from_db()
+        self.assertEqual(post.comments_count, 1)
+
+        comment.delete()
+        follow.delete()
+        post.refresh_from_db()
+        self.assertEqual(post.comments_count, 0)
+        self.assertEqual(self.counters(self.author).followers_count, 0)
+        self.assertEqual(self.counters(self.user).following_count, 0)
+        post.delete()
+        self.assertEqual(self.counters(self.author).posts_count, 0)
+
+    def test_save_and_counters_in_one_transaction(self):
+        """Запись не сохраняется, если не удалось обновить счётчики."""
+        with mock.patch.object(counters, 'change_user',
+                               side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                Post.objects.create(author=self.author, text='Пост')
+            with self.assertRaises(DatabaseError):
+                Follow.objects.create(user=self.user, author=self.author)
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(Follow.objects.exists())
+
+    def test_delete_user_with_posts_and_follows(self):
+        """Удаление пользователя с постами и подписками не ломает счётчики."""
+        author = User.objects.create_user(username='leaving')
+        post = Post.objects.create(author=author, text='Пост')
+        Comment.objects.create(post=post, author=self.user, text='Коммент')
+        Follow.objects.create(user=self.user, author=author)
+        Follow.objects.create(user=author, author=self.user)
+        author_id = author.pk
+        author.delete()
+        self.assertFalse(
+            UserCounters.objects.filter(user_id=author_id).exists()
+        )
+        self.assertEqual(self.counters(self.user).followers_count, 0)
+        self.assertEqual(self.counters(self.user).following_count, 0)
+
+    def test_delete_bulk_created_post(self):
+        """Пост без post_save удаляется, счётчик не уходит ниже нуля."""
+        Post.objects.bulk_create([Post(author=self.author, text='Пост')])
+        Post.objects.get(text='Пост').delete()
+        self.assertEqual(self.counters(self.author).posts_count, 0)
+
+    def test_rebuild_counters_command(self):
+        """Команда rebuild_counters восстанавливает счётчики."""
+        post = Post.objects.create(author=self.author, text='Пост')
+        Follow.objects.create(user=self.user, author=self.author)
+        Comment.objects.create(post=post, author=self.user, text='Коммент')
+        UserCounters.objects.all().delete()
+        Post.objects.update(comments_count=10)
+        call_command('rebuild_counters', stdout=StringIO())
+        self.assertEqual(self.counters(self.author).posts_count, 1)
+        self.assertEqual(self.counters(self.author).followers_count, 1)
+        self.assertEqual(self.counters(self.user).following_count, 1)
+        post.refresh_from_db()
+        self.assertEqual(post.comments_count, 1)
+
+    @override_settings(POST_CURSOR_PAGINATION=True)
+    def test_pages_without_count_queries(self):
+        """Профиль и пост выводят счётчики без COUNT-запросов."""
+        post = Post.objects.create(author=self.author, text='Пост')
+        Comment.objects.create(post=post, author=self.user, text='Коммент')
+        urls = (
+            reverse('posts:post_detail', kwargs={'post_id': post.id}),
+            reverse('posts:profile', kwargs={'username': 'author'}),
+        )
+        for url in urls:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = Client().get(url)
+                self.assertFalse(
+                    any('COUNT(' in query['sql'] for query in queries)
+                )
+                self.assertContains(response, 'Всего постов')
@@ -0,0 +1,114 @@
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..feed import get_feed
+from ..models import FeedEntry, Follow, Post, User
+
+
+class FeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='reader')
+        cls.author = User.objects.create_user(username='author')
+        cls.other = User.objects.create_user(username='other')
+
+    def test_post_pushed_to_followers(self):
+        """Новый пост попадает в ленты подписчиков автора."""
+        Follow.objects.create(user=self.user, author=self.author)
+        post = Post.objects.create(author=self.author, text='Новый пост')
+        Post.objects.create(author=self.other, text='Чужой пост')
+        self.assertEqual(get_feed(self.user), [post.id])
+        self.assertFalse(FeedEntry.objects.filter(user=self.other).exists())
+
+    def test_follow_and_unfollow_update_feed(self):
+        """Подписка добавляет в ленту посты автора, отписка убирает."""
+        first = Post.objects.create(author=self.author, text='Первый')
+        second = Post.objects.create(author=self.author, text='Второй')
+        follow = Follow.objects.create(user=self.user, author=self.author)
+        self.assertEqual(get_feed(self.user), [second.id, first.id])
+        follow.delete()
+        self.assertEqual(get_feed(self.user), [])
+
+    @override_settings(FEED_PUSH_LIMIT=0)
+    def test_popular_author_posts_are_pulled(self):
+        """Посты популярного автора не рассылаются, а подмешиваются."""
+        Follow.objects.create(user=self.user, author=self.other)
+        pushed = Post.objects.create(author=self.other, text='Разослан')
+        Follow.objects.create(user=self.user, author=self.author)
+        pulled = Post.objects.create(author=self.author, text='Подмешан')
+        self.assertFalse(FeedEntry.objects.filter(post=pulled).exists())
+        self.assertEqual(get_feed(self.user), [pulled.id, pushed.id])
+
+    @override_settings(FEED_PUSH_LIMIT=1)
+    def test_author_no_longer_popular_is_pushed(self):
+        """Посты бывшего популярного автора остаются в лентах."""
+        late = User.objects.create_user(username='late')
+        for user in (self.user, self.other, late):
+            Follow.objects.create(user=user, author=self.author)
+        post = Post.objects.create(author=self.author, text='Подмешан')
+        self.assertFalse(FeedEntry.objects.filter(post=post).exists())
+        Follow.objects.filter(user=self.user).delete()
+        self.assertEqual(get_feed(late), [post.id])
+        Follow.objects.get(user=self.other).delete()
+        self.assertEqual(
+            set(FeedEntry.objects.filter(
+                post=post
+            ).values_list('user_id', flat=True)),
+            {late.id},
+            'Подписавшийся во время популярности получает посты автора.'
+        )
+        self.assertEqual(get_feed(late), [post.id])
+
+    @override_settings(FEED_SIZE=2)
+    def test_feed_is_bounded(self):
+        """Лента обрезается до FEED_SIZE постов при рассылке."""
+        Follow.objects.create(user=self.user, author=self.author)
+        posts = [
+            Post.objects.create(author=self.author, text=f'Пост {number}')
+            for number in range(3)
+        ]
+        self.assertEqual(
+            set(FeedEntry.objects.filter(
+                user=self.user
+            ).values_list('post_id', flat=True)),
+            {posts[1].id, posts[2].id},
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(get_feed(self.user), [posts[2].id, posts[1].id])
+        self.assertFalse(
+            any('DELETE' in query['sql'] for query in queries)
+        )
+
+    @override_settings(FEED_SIZE=2)
+    def test_feed_is_bounded_on_follow(self):
+        """Подписка на автора не раздувает ленту больше FEED_SIZE."""
+        Follow.objects.create(user=self.user, author=self.author)
+        for number in range(2):
+            Post.objects.create(author=self.author, text=f'Пост {number}')
+        newer = [
+            Post.objects.create(author=self.other, text=f'Новый {number}')
+            for number in range(2)
+        ]
+        Follow.objects.create(user=self.user, author=self.other)
+        self.assertEqual(
+            set(FeedEntry.objects.filter(
+                user=self.user
+            ).values_list('post_id', flat=True)),
+            {post.id for post in newer},
+        )
+
+    def test_follow_index_reads_feed(self):
+        """Страница подписок показывает посты ленты по порядку."""
+        Follow.objects.create(user=self.user, author=self.author)
+        posts = [
+            Post.objects.create(author=self.author, text=f'Пост {number}')
+            for number in range(3)
+        ]
+        client = Client()
+        client.force_login(self.user)
+        response = client.get(reverse('posts:follow_index'))
+        self.assertEqual(
+            list(response.context['page_obj']), posts[::-1]
+        )
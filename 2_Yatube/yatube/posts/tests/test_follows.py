@@ -0,0 +1,67 @@
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..follows import SESSION_KEY
+from ..models import Follow, User, UserCounters
+
+
+class FollowResolverTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='reader')
+        cls.author = User.objects.create_user(username='author')
+        cls.other = User.objects.create_user(username='other')
+
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def profile(self, user, client=None):
+        return (client or self.client).get(
+            reverse('posts:profile', kwargs={'username': user.username})
+        )
+
+    def test_following_in_profile(self):
+        """following в профиле зависит от подписок зрителя."""
+        Follow.objects.create(user=self.other, author=self.author)
+        self.assertFalse(self.profile(self.author).context['following'])
+        Follow.objects.create(user=self.user, author=self.author)
+        self.assertTrue(self.profile(self.author).context['following'])
+        self.assertFalse(self.profile(self.other).context['following'])
+        self.assertFalse(self.profile(self.user).context['following'])
+        self.assertFalse(
+            self.profile(self.author, Client()).context['following']
+        )
+
+    def test_follows_cached_in_session(self):
+        """Подписки читаются из сессии, пока они не изменились."""
+        self.client.get(reverse('posts:profile_follow', args=['author']))
+        self.assertTrue(self.profile(self.author).context['following'])
+        self.assertEqual(
+            self.client.session[SESSION_KEY]['ids'], [self.author.pk]
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(self.profile(self.author).context['following'])
+        self.assertFalse(
+            any('posts_follow' in query['sql'] for query in queries)
+        )
+        self.client.get(reverse('posts:profile_unfollow', args=['author']))
+        self.assertFalse(self.profile(self.author).context['following'])
+
+    def test_stale_session_follows_dropped(self):
+        """Список из сессии со старой версией подписок перечитывается."""
+        self.assertFalse(self.profile(self.author).context['following'])
+        version = self.client.session[SESSION_KEY]['version']
+        Follow.objects.bulk_create(
+            [Follow(user=self.user, author=self.author)]
+        )
+        self.assertFalse(self.profile(self.author).context['following'])
+        UserCounters.objects.filter(user=self.user).update(
+            follows_version=version + 1
+        )
+        self.assertTrue(self.profile(self.author).context['following'])
+        self.assertEqual(
+            self.client.session[SESSION_KEY]['version'], version + 1
+        )
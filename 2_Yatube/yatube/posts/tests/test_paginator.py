@@ -0,0 +1,78 @@
+from django.conf import settings
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..models import Group, Post, User
+from ..utils import decode_cursor, encode_cursor
+
+POSTS_COUNT = 25
+
+
+class CursorPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author')
+        cls.group = Group.objects.create(
+            title='Тестовая группа',
+            slug='test-slug',
+            description='Тестовое описание',
+        )
+        Post.objects.bulk_create(
+            Post(author=cls.author, group=cls.group, text=f'Пост {number}')
+            for number in range(POSTS_COUNT)
+        )
+        cls.posts = list(Post.objects.order_by('-pub_date', '-pk'))
+        cls.url = reverse(
+            'posts:group_list', kwargs={'slug': cls.group.slug}
+        )
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_cursor_roundtrip(self):
+        """Курсор однозначно кодирует (pub_date, id)."""
+        post = self.posts[0]
+        self.assertEqual(
+            decode_cursor(encode_cursor(post)), (post.pub_date, post.pk)
+        )
+        self.assertIsNone(decode_cursor('испорчен'))
+
+    @override_settings(POST_CURSOR_PAGINATION=True)
+    def test_pages_without_count(self):
+        """Курсорные страницы идут вперёд и назад без COUNT(*)."""
+        pages = []
+        params = {}
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url, params)
+            self.assertFalse(
+                any('COUNT(' in query['sql'] for query in queries)
+            )
+            page_obj = response.context['page_obj']
+            pages.append(list(page_obj))
+            if not page_obj.has_next():
+                break
+            params = {'after': page_obj.next_cursor}
+        self.assertEqual(
+            [len(page) for page in pages],
+            [settings.POST_LOAD, settings.POST_LOAD, 5]
+        )
+        self.assertEqual(sum(pages, []), self.posts)
+
+        response = self.client.get(
+            self.url, {'before': page_obj.previous_cursor}
+        )
+        self.assertEqual(list(response.context['page_obj']), pages[1])
+        self.assertTrue(response.context['page_obj'].has_previous())
+        self.assertContains(response, '?after=')
+        self.assertContains(response, '?before=')
+
+    def test_page_numbers_by_default(self):
+        """Без курсора остаётся постраничная навигация по номерам."""
+        response = self.client.get(self.url, {'page': 3})
+        self.assertEqual(
+            list(response.context['page_obj']), self.posts[20:]
+        )
+        self.assertContains(response, '?page=1')
@@ -1,13 +1,15 @@
 import shutil
 import tempfile
+from unittest import mock
 
 from django import forms
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import cache, caches
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
+from .. import caching
 from ..models import Comment, Follow, Group, Post, User
 
 TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
@@ -210,13 +212,69 @@ class PostViewsTests(TestCase):
         )
 
     def test_check_cache(self):
-        """Проверка кеша."""
-        response = self.guest_client.get(self.reverse_index)
-        response_before = response.content
-        Post.objects.latest().delete()
-        response2 = self.guest_client.get(self.reverse_index)
-        response_after = response2.content
-        self.assertEqual(response_before, response_after)
+        """Проверка кеша: фрагмент живёт до изменения постов."""
+        for url in (self.reverse_index, self.reverse_group):
+            with self.subTest(url=url):
+                response_before = self.guest_client.get(url).content
+                Post.objects.filter(pk=self.post.pk).update(text='Изменён')
+                response_cached = self.guest_client.get(url).content
+                self.assertEqual(response_before, response_cached)
+                Post.objects.get(pk=self.post.pk).save()
+                response_after = self.guest_client.get(url).content
+                self.assertNotEqual(response_before, response_after)
+                Post.objects.filter(pk=self.post.pk).update(
+                    text='Тестовый пост'
+                )
+
+    def test_cache_invalidated_on_delete_and_comment(self):
+        """Удаление поста и комментарий сбрасывают кеш страниц."""
+        post = Post.objects.create(
+            author=self.author, text='Пост для удаления', group=self.group
+        )
+        for url in (self.reverse_index, self.reverse_group):
+            self.guest_client.get(url)
+        versions = {
+            section: caching.get_version(section)
+            for section in ('index', f'group:{self.group.id}')
+        }
+        Comment.objects.create(post=post, author=self.user, text='Коммент')
+        for section, version in versions.items():
+            with self.subTest(section=section):
+                self.assertNotEqual(caching.get_version(section), version)
+        post.delete()
+        for url in (self.reverse_index, self.reverse_group):
+            with self.subTest(url=url):
+                response = self.guest_client.get(url)
+                self.assertNotContains(response, 'Пост для удаления')
+
+    @override_settings(POSTS_FRAGMENT_TIMEOUT=123)
+    def test_cache_fragments_expire(self):
+        """Фрагменты страниц кешируются с ограниченным сроком жизни."""
+        cache.clear()
+        fragment_cache = caches['default']
+        with mock.patch.object(fragment_cache, 'set',
+                               wraps=fragment_cache.set) as cache_set:
+            for url in (self.reverse_index, self.reverse_group):
+                with self.subTest(url=url):
+                    response = self.guest_client.get(url)
+                    self.assertEqual(response.context['cache_timeout'], 123)
+        timeouts = [
+            call[0][2] for call in cache_set.call_args_list
+            if call[0][0].startswith('template.cache.')
+        ]
+        self.assertEqual(timeouts, [123, 123])
+
+    def test_cache_keyed_by_page(self):
+        """Каждая страница кешируется отдельно."""
+        Post.objects.bulk_create(
+            Post(author=self.author, text=f'Пост {number}')
+            for number in range(settings.POST_LOAD)
+        )
+        caching.invalidate('index')
+        first = self.guest_client.get(self.reverse_index)
+        second = self.guest_client.get(self.reverse_index, {'page': 2})
+        self.assertNotEqual(first.content, second.content)
+        self.assertContains(second, 'Тестовый пост')
 
     def test_follow_page(self):
         "Проверка системы подписки."
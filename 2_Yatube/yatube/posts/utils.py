@@ -1,8 +1,97 @@
 from django.conf import settings
 from django.core.paginator import Paginator
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+
+def encode_cursor(post):
+    return urlsafe_base64_encode(
+        f'{post.pub_date.isoformat()}|{post.pk}'.encode()
+    )
+
+
+def decode_cursor(cursor):
+    """Возвращает (pub_date, id) из курсора или None, если он испорчен."""
+    try:
+        pub_date, pk = urlsafe_base64_decode(cursor).decode().split('|')
+        pub_date, pk = parse_datetime(pub_date), int(pk)
+    except (TypeError, ValueError):
+        return None
+    return (pub_date, pk) if pub_date else None
+
+
+class CursorPage:
+    """Страница постов до или после курсора (pub_date, id).
+
+    Не требует COUNT(*) и OFFSET: выбирается на один пост больше
+    страницы, чтобы узнать, есть ли следующая.
+    """
+
+    is_cursor = True
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self.object_list[-1]) if self._has_next else None
+
+    @property
+    def previous_cursor(self):
+        if not self._has_previous:
+            return None
+        return encode_cursor(self.object_list[0])
+
+
+def get_cursor_page(request, posts):
+    per_page = settings.POST_LOAD
+    after = decode_cursor(request.GET.get('after', ''))
+    before = decode_cursor(request.GET.get('before', ''))
+    if before:
+        pub_date, pk = before
+        object_list = list(posts.filter(
+            Q(pub_date__gt=pub_date) | Q(pub_date=pub_date, pk__gt=pk)
+        ).order_by('pub_date', 'pk')[:per_page + 1])
+        has_previous = len(object_list) > per_page
+        return CursorPage(object_list[:per_page][::-1], True, has_previous)
+    if after:
+        pub_date, pk = after
+        posts = posts.filter(
+            Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, pk__lt=pk)
+        )
+    object_list = list(posts.order_by('-pub_date', '-pk')[:per_page + 1])
+    return CursorPage(
+        object_list[:per_page], len(object_list) > per_page, bool(after)
+    )
 
 
 def get_page(request, posts):
+    cursor_mode = settings.POST_CURSOR_PAGINATION or (
+        'after' in request.GET or 'before' in request.GET
+    )
+    if cursor_mode and isinstance(posts, QuerySet):
+        return get_cursor_page(request, posts)
     paginator = Paginator(posts, settings.POST_LOAD)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404, redirect, render
 
+from .caching import fragment_key
+from .feed import get_feed
 from .forms import CommentForm, PostForm
 from .models import Comment, Follow, Group, Post, User
 from .utils import get_page
@@ -12,7 +15,11 @@ def index(request):
     return render(
         request,
         "posts/index.html",
-        {"page_obj": page_obj},
+        {
+            "page_obj": page_obj,
+            "cache_key": fragment_key(request, 'index'),
+            "cache_timeout": settings.POSTS_FRAGMENT_TIMEOUT,
+        },
     )
 
 
@@ -23,16 +30,22 @@ def group_posts(request, slug):
     return render(
         request,
         "posts/group_list.html",
-        {"group": group, "page_obj": page_obj},
+        {
+            "group": group,
+            "page_obj": page_obj,
+            "cache_key": fragment_key(request, f'group:{group.id}'),
+            "cache_timeout": settings.POSTS_FRAGMENT_TIMEOUT,
+        },
     )
 
 
 def profile(request, username):
-    author = get_object_or_404(User, username=username)
+    author = get_object_or_404(
+        User.objects.select_related('counters'), username=username
+    )
     post_list = author.posts.select_related('group')
     page_obj = get_page(request, post_list)
-    following = author.is_authenticated and (
-        request.user != author) and Follow.objects.filter().exists()
+    following = request.follows.is_following(author)
     return render(
         request,
         "posts/profile.html",
@@ -41,7 +54,9 @@ def profile(request, username):
 
 
 def post_detail(request, post_id):
-    post = get_object_or_404(Post, pk=post_id)
+    post = get_object_or_404(
+        Post.objects.select_related('group', 'author__counters'), pk=post_id
+    )
     form = CommentForm(request.POST or None)
     comments = Comment.objects.filter(post=post).select_related('author')
     return render(
@@ -106,12 +121,14 @@ def add_comment(request, post_id):
 
 @login_required
 def follow_index(request):
-    follower = Follow.objects.filter(
-        user=request.user).values_list(
-        "author_id", flat=True
+    page_obj = get_page(request, get_feed(request.user))
+    posts = Post.objects.select_related('group', 'author').in_bulk(
+        page_obj.object_list
     )
-    posts = Post.objects.filter(author_id__in=follower)
-    page_obj = get_page(request, posts)
+    page_obj.object_list = [
+        posts[post_id] for post_id in page_obj.object_list
+        if post_id in posts
+    ]
     return render(
         request,
         "posts/follow.html",
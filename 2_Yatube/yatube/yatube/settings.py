@@ -62,6 +62,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "posts.follows.FollowResolverMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -101,6 +102,10 @@ DATABASES = {
 
 POST_LOAD = 10
 POST_NUMBER = 15
+POST_CURSOR_PAGINATION = False
+FEED_SIZE = 1000
+FEED_BATCH_SIZE = 500
+FEED_PUSH_LIMIT = 1000
 
 
 # Password validation
@@ -146,8 +151,18 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 CSRF_FAILURE_VIEW = 'core.views.csrf_failure'
 
+# Shared cache for all workers is set by environment, e.g.
+# CACHE_BACKEND=django.core.cache.backends.memcached.MemcachedCache
+# CACHE_LOCATION=127.0.0.1:11211
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
     }
 }
+POSTS_CACHE_ALIAS = 'default'
+# Fragments are dropped by signals; the timeout only evicts the ones
+# left behind by old versions.
+POSTS_FRAGMENT_TIMEOUT = 60 * 60 * 24 * 7
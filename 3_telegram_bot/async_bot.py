@@ -0,0 +1,152 @@
+"""Asyncio version of the homework status bot."""
+
+import asyncio
+import sys
+import time
+from http import HTTPStatus
+from json import JSONDecodeError
+from typing import Optional
+
+import aiohttp
+
+import exceptions
+import homework
+from homework import (check_response, get_status_changes, homework_key,
+                      join_messages, logger, parse_status)
+from scheduler import PollScheduler
+
+TELEGRAM_API = 'https://api.telegram.org'
+
+
+async def get_api_answer_async(session: aiohttp.ClientSession,
+                               timestamp: int,
+                               token: str,
+                               endpoint: str = homework.ENDPOINT) -> dict:
+    """Get API response without blocking the event loop."""
+    try:
+        async with session.get(
+            endpoint,
+            headers={'Authorization': f'OAuth {token}'},
+            params={'from_date': timestamp}
+        ) as response:
+            if response.status != HTTPStatus.OK:
+                raise exceptions.APIDoNotResponde(
+                    f"Endpoint {endpoint} doesn't work \n"
+                    f'API response code: {response.status}'
+                )
+            try:
+                return await response.json(content_type=None)
+            except JSONDecodeError:
+                raise exceptions.JSONFormatException(
+                    "API response coudn't recieve JSON format"
+                )
+    except aiohttp.ClientError as error:
+        raise exceptions.APIDoNotResponde(
+            f"Endpoint {endpoint} doesn't work: {error}"
+        ) from error
+
+
+async def send_message_async(session: aiohttp.ClientSession,
+                             token: str,
+                             chat_id: str,
+                             message: str,
+                             api_url: str = TELEGRAM_API) -> bool:
+    """Send message to telegram chat through the Bot HTTP API."""
+    logger.info('Trying to send message...')
+    try:
+        async with session.post(
+            f'{api_url}/bot{token}/sendMessage',
+            json={'chat_id': chat_id, 'text': message}
+        ) as response:
+            response.raise_for_status()
+        logger.debug(f'Message successfully sent: \n{message}')
+        return True
+    except aiohttp.ClientError as error:
+        logger.error(error)
+        return False
+
+
+class AsyncHomeworkBot:
+    """Poll one Practicum account and notify one telegram chat."""
+
+    def __init__(self,
+                 session: aiohttp.ClientSession,
+                 practicum_token: str,
+                 telegram_token: str,
+                 chat_id: str,
+                 endpoint: str = homework.ENDPOINT,
+                 telegram_api: str = TELEGRAM_API,
+                 retry_period: float = homework.RETRY_PERIOD,
+                 timestamp: Optional[int] = None) -> None:
+        """Store session, credentials and polling state."""
+        self.session = session
+        self.practicum_token = practicum_token
+        self.telegram_token = telegram_token
+        self.chat_id = chat_id
+        self.endpoint = endpoint
+        self.telegram_api = telegram_api
+        self.retry_period = retry_period
+        if timestamp is None:
+            timestamp = int(time.time() - homework.TWO_WEEKS_TIMESTAMP)
+        self.timestamp = timestamp
+        self.previous_statuses: dict[str, str] = {}
+        self.previous_error: Optional[str] = None
+        self.scheduler = PollScheduler(retry_period, self.previous_statuses)
+
+    async def notify(self, message: str) -> bool:
+        """Send message to the chat of this bot."""
+        return await send_message_async(self.session,
+                                        self.telegram_token,
+                                        self.chat_id,
+                                        message,
+                                        self.telegram_api)
+
+    async def check_once(self) -> float:
+        """Poll API once and notify about status change or new error.
+
+        Return pause before the next poll chosen by the scheduler.
+        """
+        try:
+            response = await get_api_answer_async(self.session,
+                                                  self.timestamp,
+                                                  self.practicum_token,
+                                                  self.endpoint)
+            self.timestamp = response.get('current_date', self.timestamp)
+            homeworks = check_response(response)
+            changes = get_status_changes(homeworks, self.previous_statuses)
+            if not changes:
+                logger.debug('No status updates')
+            messages = [parse_status(item) for item in changes]
+            for message in join_messages(messages):
+                await self.notify(message)
+            for item in changes:
+                self.previous_statuses[homework_key(item)] = item['status']
+            return self.scheduler.success(bool(changes))
+        except Exception as error:
+            if self.previous_error != str(error):
+                logger.error(error)
+                await self.notify(f'Program crash: {error}')
+                self.previous_error = str(error)
+            return self.scheduler.failure(error)
+
+    async def run(self) -> None:
+        """Poll API forever with pauses chosen by the scheduler."""
+        while True:
+            await asyncio.sleep(await self.check_once())
+
+
+async def main_async() -> None:
+    """Main bot logic on top of asyncio."""
+    logger.info('Async bot has started')
+    if not homework.check_tokens():
+        sys.exit('The program will be forced to stop')
+    async with aiohttp.ClientSession() as session:
+        bot = AsyncHomeworkBot(session,
+                               homework.PRACTICUM_TOKEN,
+                               homework.TELEGRAM_TOKEN,
+                               homework.TELEGRAM_CHAT_ID)
+        await bot.run()
+
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
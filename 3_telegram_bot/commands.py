@@ -0,0 +1,88 @@
+"""On-demand answers to telegram commands from the cached API data."""
+
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from telegram.ext import CommandHandler, Filters, Updater
+
+NO_DATA_MESSAGE = 'No data from API yet, wait for the next check'
+
+
+class StatusCache:
+    """Last known state of every homework seen by the poll loop.
+
+    API returns only homeworks changed since `from_date`, so every
+    response is merged into the cache instead of replacing it. Cache
+    may be seeded with homeworks saved before restart; they do not
+    count as a check.
+    """
+
+    def __init__(self, key: Callable[[dict], str],
+                 homeworks: Iterable[dict] = ()) -> None:
+        """Set function identifying homework and known homeworks."""
+        self.key = key
+        self.lock = threading.Lock()
+        self.homeworks: dict[str, dict] = {
+            key(homework): homework for homework in homeworks
+        }
+        self.updated: Optional[float] = None
+
+    def touch(self) -> None:
+        """Remember time of a successful API answer."""
+        with self.lock:
+            self.updated = time.time()
+
+    def update(self, homeworks: list) -> None:
+        """Remember homeworks from the checked API response."""
+        with self.lock:
+            for homework in homeworks:
+                self.homeworks[self.key(homework)] = homework
+            self.updated = time.time()
+
+    def get(self) -> tuple[list, Optional[float]]:
+        """Get known homeworks and time of the last update."""
+        with self.lock:
+            return list(self.homeworks.values()), self.updated
+
+
+def status_reply(cache: StatusCache, verdicts: dict[str, str]) -> str:
+    """Describe status of every cached homework."""
+    homeworks, updated = cache.get()
+    if updated is None and not homeworks:
+        return NO_DATA_MESSAGE
+    lines = [
+        f'"{homework.get("homework_name")}": '
+        f'{verdicts.get(homework.get("status"), homework.get("status"))}'
+        for homework in homeworks
+    ]
+    if updated is None:
+        lines.append('Last check: not yet since restart')
+    else:
+        checked = time.strftime('%Y-%m-%d %H:%M:%S',
+                                time.localtime(updated))
+        lines.append(f'Last check: {checked}')
+    return '\n\n'.join(lines)
+
+
+def status_handler(cache: StatusCache, verdicts: dict[str, str],
+                   chat_id: str) -> CommandHandler:
+    """Create `/status` handler answering only the bot owner chat."""
+    def status(update, context) -> None:
+        update.message.reply_text(status_reply(cache, verdicts))
+
+    return CommandHandler('status', status,
+                          filters=Filters.chat(chat_id=int(chat_id)))
+
+
+def start_command_receiver(token: str, cache: StatusCache,
+                           verdicts: dict[str, str],
+                           chat_id: str) -> Updater:
+    """Receive commands by long polling in a background thread.
+
+    Answers come from `cache` only and never reach Practicum API.
+    """
+    updater = Updater(token=token)
+    updater.dispatcher.add_handler(status_handler(cache, verdicts, chat_id))
+    updater.start_polling()
+    return updater
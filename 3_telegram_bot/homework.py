@@ -13,12 +13,25 @@ import telegram
 from dotenv import load_dotenv
 
 import exceptions
+import metrics
+from commands import StatusCache, start_command_receiver
+from http_session import ConditionalSession
+from log_queue import start_queue_logging
+from outbox import TELEGRAM_MESSAGE_LIMIT, Outbox
+from scheduler import PollScheduler
+from state import StateStore
 
 load_dotenv()
 
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+PRACTICUM_KEEP_ALIVE = os.getenv('PRACTICUM_KEEP_ALIVE') == '1'
+BOT_STATE_PATH = os.getenv('BOT_STATE_PATH', ':memory:')
+TELEGRAM_OUTBOX_PATH = os.getenv('TELEGRAM_OUTBOX_PATH')
+BOT_LOG_QUEUE = os.getenv('BOT_LOG_QUEUE') == '1'
+METRICS_PORT = os.getenv('METRICS_PORT')
+TELEGRAM_COMMANDS = os.getenv('TELEGRAM_COMMANDS') == '1'
 
 RETRY_PERIOD = 600
 TWO_WEEKS_TIMESTAMP = 1209600
@@ -29,6 +42,7 @@ HOMEWORK_VERDICTS: dict[str, str] = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+HTTP_SESSION = ConditionalSession() if PRACTICUM_KEEP_ALIVE else None
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -40,6 +54,8 @@ formatter = logging.Formatter(
 r_handler.setFormatter(formatter)
 logger.addHandler(s_handler)
 logger.addHandler(r_handler)
+if BOT_LOG_QUEUE:
+    start_queue_logging(logger)
 
 
 def check_tokens() -> bool:
@@ -59,6 +75,7 @@ def check_tokens() -> bool:
     return all([PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID])
 
 
+@metrics.instrument
 def send_message(bot: telegram.Bot, message: str) -> None:
     """Send message to telegram chat."""
     logger.info('Trying to send message...')
@@ -66,32 +83,42 @@ def send_message(bot: telegram.Bot, message: str) -> None:
         bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
         logger.debug(f'Message successfully sent: \n{message}')
     except Exception as error:
+        metrics.count_error('send_message', error)
         logger.error(error)
 
 
+@metrics.instrument
 def get_api_answer(timestamp: int) -> dict:
     """Get API response."""
     timestamp: int = {'from_date': timestamp}
     try:
-        homework_statuses = requests.get(
+        homework_statuses = (HTTP_SESSION or requests).get(
             ENDPOINT,
             headers=HEADERS,
             params=timestamp)
     except requests.RequestException as e:
         logger.error(e)
+        raise exceptions.APIDoNotResponde(
+            f"Endpoint {ENDPOINT} doesn't respond: {e}"
+        ) from e
     if homework_statuses.status_code != HTTPStatus.OK:
         raise exceptions.APIDoNotResponde(
             f"Endpoint {ENDPOINT} doesn't work \n"
             f'API response code: {homework_statuses.status_code}'
         )
     try:
-        return homework_statuses.json()
+        answer = homework_statuses.json()
     except JSONDecodeError:
         raise exceptions.JSONFormatException(
             "API response coudn't recieve JSON format"
         )
+    if getattr(homework_statuses, 'from_cache', False) and isinstance(
+            answer, dict):
+        answer['current_date'] = timestamp['from_date']
+    return answer
 
 
+@metrics.instrument
 def check_response(response: dict) -> dict:
     """Check if API response is valid."""
     if 'current_date' not in response:
@@ -115,6 +142,7 @@ def check_response(response: dict) -> dict:
     return homeworks_list
 
 
+@metrics.instrument
 def parse_status(homework: dict) -> str:
     """Get homework status from API response."""
     if 'homework_name' not in homework:
@@ -131,35 +159,94 @@ def parse_status(homework: dict) -> str:
     return message
 
 
+def homework_key(homework: dict) -> str:
+    """Get key identifying homework: its id or, if absent, its name."""
+    return str(homework.get('id', homework.get('homework_name')))
+
+
+def get_status_changes(homeworks: list,
+                       previous_statuses: dict[str, str]) -> list[dict]:
+    """Get homeworks whose status differs from the previously seen one."""
+    return [
+        homework for homework in homeworks
+        if homework.get('status') != previous_statuses.get(
+            homework_key(homework)
+        )
+    ]
+
+
+def join_messages(messages: list[str],
+                  limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[str]:
+    """Pack messages into as few telegram messages as the limit allows."""
+    batches: list[str] = []
+    for message in messages:
+        if batches and len(batches[-1]) + 2 + len(message) <= limit:
+            batches[-1] = f'{batches[-1]}\n\n{message}'
+        else:
+            batches.append(message)
+    return batches
+
+
+def start_services(bot: telegram.Bot,
+                   cache: StatusCache) -> telegram.Bot:
+    """Start enabled background services and get bot to send through."""
+    metrics.start_metrics_server(METRICS_PORT)
+    if TELEGRAM_COMMANDS:
+        start_command_receiver(TELEGRAM_TOKEN, cache, HOMEWORK_VERDICTS,
+                               TELEGRAM_CHAT_ID)
+    if TELEGRAM_OUTBOX_PATH:
+        return Outbox(bot, TELEGRAM_OUTBOX_PATH, log=logger).start()
+    return bot
+
+
 def main():
     """Main bot logic."""
     logger.info('Bot has started')
     if not check_tokens():
         sys.exit('The program will be forced to stop')
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
-    timestamp: int = int(time.time() - TWO_WEEKS_TIMESTAMP)
-    previous_status = None
-    previous_error = None
+    store = StateStore(BOT_STATE_PATH)
+    cache = StatusCache(homework_key, store.get_homeworks())
+    bot = start_services(bot, cache)
+    timestamp: int = store.get_timestamp(
+        int(time.time() - TWO_WEEKS_TIMESTAMP)
+    )
+    previous_statuses: dict[str, str] = store.get_statuses()
+    previous_error = store.get_error()
+    scheduler = PollScheduler(RETRY_PERIOD, previous_statuses)
     while True:
+        delay: float = RETRY_PERIOD
         try:
+            metrics.POLLS.inc()
             response: dict = get_api_answer(timestamp)
+            cache.touch()
             timestamp = response.get('current_date', timestamp)
             homeworks: dict = check_response(response)
-            homework_status = homeworks[0].get('status')
-            if homework_status == previous_status:
+            cache.update(homeworks)
+            changes = get_status_changes(homeworks, previous_statuses)
+            metrics.STATUS_CHANGES.inc(len(changes))
+            if not changes:
                 logger.debug('No status updates')
-            else:
-                previous_status = homework_status
-                message = parse_status(homeworks[0])
+            messages = [parse_status(homework) for homework in changes]
+            for message in join_messages(messages):
                 send_message(bot, message)
+            for homework in changes:
+                key = homework_key(homework)
+                previous_statuses[key] = homework['status']
+                store.save_status(key, homework['status'])
+                store.save_homework(key, homework)
+            store.save_timestamp(timestamp)
+            delay = scheduler.success(bool(changes))
         except Exception as error:
+            delay = scheduler.failure(error)
             message: str = f'Program crash: {error}'
             if previous_error != str(error):
                 logger.error(error)
                 send_message(bot, message)
                 previous_error: str = str(error)
+                store.save_error(previous_error)
         finally:
-            time.sleep(RETRY_PERIOD)
+            time.sleep(delay)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,62 @@
+"""Keep-alive HTTP session with conditional GET requests."""
+
+import copy
+from http import HTTPStatus
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ConditionalSession(requests.Session):
+    """Pooled keep-alive session revalidating GET responses.
+
+    Last successful response of every endpoint is remembered together
+    with its `ETag`/`Last-Modified` validators. Next GET to the same
+    endpoint sends `If-None-Match`/`If-Modified-Since` whatever its query
+    parameters are, so the bot moving `from_date` forward still gets
+    revalidated, and `304 Not Modified` answer is replaced with a copy
+    of the remembered response marked with `from_cache`, so unchanged
+    data costs no response body. Remembered body belongs to an older
+    request, so caller must not take request-dependent values such as
+    `current_date` from it. At most `max_entries` endpoints are
+    remembered, the oldest one is forgotten first.
+    """
+
+    def __init__(self, pool_size: int = 1, max_entries: int = 16) -> None:
+        """Mount pooled adapters and set keep-alive and gzip headers."""
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.headers.update({'Accept-Encoding': 'gzip, deflate',
+                             'Connection': 'keep-alive'})
+        self.cache: Dict[str, requests.Response] = {}
+        self.max_entries = max_entries
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send conditional GET request."""
+        headers = dict(kwargs.pop('headers', None) or {})
+        key = urlsplit(url)._replace(query='', fragment='').geturl()
+        cached = self.cache.get(key)
+        if cached is not None:
+            if 'ETag' in cached.headers:
+                headers['If-None-Match'] = cached.headers['ETag']
+            if 'Last-Modified' in cached.headers:
+                headers['If-Modified-Since'] = cached.headers['Last-Modified']
+        response = super().get(url, headers=headers, **kwargs)
+        if (response.status_code == HTTPStatus.NOT_MODIFIED
+                and cached is not None):
+            revalidated = copy.copy(cached)
+            revalidated.from_cache = True
+            return revalidated
+        if (response.status_code == HTTPStatus.OK
+                and ('ETag' in response.headers
+                     or 'Last-Modified' in response.headers)):
+            self.cache.pop(key, None)
+            self.cache[key] = response
+            while len(self.cache) > self.max_entries:
+                del self.cache[next(iter(self.cache))]
+        return response
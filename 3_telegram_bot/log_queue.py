@@ -0,0 +1,65 @@
+"""Non-blocking logging: handlers served by a background listener."""
+
+import atexit
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Build JSON with time, logger, level, thread and message."""
+        data = {
+            'time': self.formatTime(record),
+            'name': record.name,
+            'level': record.levelname,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+def start_queue_logging(logger: logging.Logger,
+                        formatter: Optional[logging.Formatter] = None
+                        ) -> QueueListener:
+    """Move logger handlers behind a queue served by a listener thread.
+
+    Logger keeps only a `QueueHandler`, so logging call just puts
+    a record into the queue; writing to stream and file, including
+    rotation, happens in the listener thread. Handlers get
+    `JSONFormatter` unless other formatter is given. Repeated call
+    returns the already running listener.
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandler):
+            return handler.listener
+    formatter = formatter or JSONFormatter()
+    handlers = list(logger.handlers)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        logger.removeHandler(handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers,
+                             respect_handler_level=True)
+    queue_handler.listener = listener
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(stop_queue_logging, logger)
+    return listener
+
+
+def stop_queue_logging(logger: logging.Logger) -> None:
+    """Flush queued records and give handlers back to the logger."""
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+            handler.listener.stop()
+            for target in handler.listener.handlers:
+                logger.addHandler(target)
@@ -0,0 +1,192 @@
+"""Prometheus-style metrics of the bot and a local endpoint serving them."""
+
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _labels(names: tuple, values: tuple, **extra) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in pairs) + '}'
+
+
+class Metric(ABC):
+    """Base of metrics split by label values."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str,
+                 labels: tuple = ()) -> None:
+        """Set metric name, help text and label names."""
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.values: dict = {}
+        self.lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def collect(self) -> list[str]:
+        """Get metric lines in the text exposition format."""
+        lines = [f'# HELP {self.name} {self.documentation}',
+                 f'# TYPE {self.name} {self.kind}']
+        with self.lock:
+            for key, value in sorted(self.values.items()):
+                lines.extend(self._samples(key, value))
+        return lines
+
+    @abstractmethod
+    def _samples(self, key: tuple, value) -> list[str]:
+        """Get sample lines of one label set."""
+
+
+class Counter(Metric):
+    """Monotonic counter."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Increase counter of the given labels by `amount`."""
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """Get current value of the given labels."""
+        return self.values.get(self._key(labels), 0)
+
+    def _samples(self, key: tuple, value: float) -> list[str]:
+        return [f'{self.name}{_labels(self.labels, key)} {value}']
+
+
+class Histogram(Metric):
+    """Distribution of observed values over cumulative buckets."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str,
+                 labels: tuple = (),
+                 buckets: tuple = LATENCY_BUCKETS) -> None:
+        """Set metric name, help text, label names and bucket bounds."""
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels) -> None:
+        """Record a value for the given labels."""
+        key = self._key(labels)
+        with self.lock:
+            data = self.values.setdefault(
+                key, {'buckets': [0] * len(self.buckets),
+                      'count': 0, 'sum': 0.0}
+            )
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data['buckets'][index] += 1
+            data['count'] += 1
+            data['sum'] += value
+
+    def count(self, **labels) -> int:
+        """Get number of values observed for the given labels."""
+        data = self.values.get(self._key(labels))
+        return data['count'] if data else 0
+
+    def _samples(self, key: tuple, data: dict) -> list[str]:
+        samples = [
+            f'{self.name}_bucket{_labels(self.labels, key, le=bound)} '
+            f'{count}'
+            for bound, count in zip(self.buckets, data['buckets'])
+        ]
+        samples.append(
+            f'{self.name}_bucket{_labels(self.labels, key, le="+Inf")} '
+            f'{data["count"]}'
+        )
+        samples.append(
+            f'{self.name}_sum{_labels(self.labels, key)} {data["sum"]}'
+        )
+        samples.append(
+            f'{self.name}_count{_labels(self.labels, key)} {data["count"]}'
+        )
+        return samples
+
+
+LATENCY = Histogram('bot_call_duration_seconds',
+                    'Duration of bot function calls.', ('function',))
+ERRORS = Counter('bot_errors_total',
+                 'Errors of bot function calls.', ('function', 'exception'))
+POLLS = Counter('bot_polls_total', 'Practicum API polls.')
+STATUS_CHANGES = Counter('bot_status_changes_total',
+                         'Homework status changes found.')
+REGISTRY = [LATENCY, ERRORS, POLLS, STATUS_CHANGES]
+
+
+def render(registry: list = REGISTRY) -> str:
+    """Get all metrics in the text exposition format."""
+    lines = []
+    for metric in registry:
+        lines.extend(metric.collect())
+    return '\n'.join(lines) + '\n'
+
+
+def count_error(function: str, error: Exception) -> None:
+    """Count an error handled inside the function."""
+    ERRORS.inc(function=function, exception=type(error).__name__)
+
+
+def instrument(func: Callable) -> Callable:
+    """Measure duration of function calls and count raised errors."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:
+            count_error(func.__name__, error)
+            raise
+        finally:
+            LATENCY.observe(time.perf_counter() - start,
+                            function=func.__name__)
+    return wrapper
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Answer any GET request with the current metrics."""
+
+    registry: list = REGISTRY
+
+    def do_GET(self) -> None:
+        """Send metrics."""
+        body = render(self.registry).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Do not log scrapes."""
+
+
+def start_metrics_server(port: Optional[int],
+                         host: str = '127.0.0.1'
+                         ) -> Optional[ThreadingHTTPServer]:
+    """Serve metrics from a background thread.
+
+    Without `port` metrics are only collected and nothing is served.
+    """
+    if port in (None, ''):
+        return None
+    server = ThreadingHTTPServer((host, int(port)), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics',
+                     daemon=True).start()
+    return server
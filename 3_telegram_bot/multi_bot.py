@@ -0,0 +1,108 @@
+"""Multi-tenant mode: poll many Practicum accounts from one process."""
+
+import asyncio
+import json
+import math
+import os
+import sys
+from typing import List, NamedTuple
+
+import aiohttp
+
+import homework
+from async_bot import TELEGRAM_API, AsyncHomeworkBot
+from homework import logger
+
+TENANTS_CONFIG = os.getenv('TENANTS_CONFIG', 'tenants.json')
+CONNECTIONS_PER_HOST = 4
+
+
+class Tenant(NamedTuple):
+    """Credentials of one polled account."""
+
+    practicum_token: str
+    chat_id: str
+    telegram_token: str
+
+
+def load_tenants(path: str) -> List[Tenant]:
+    """Load tenants from JSON config.
+
+    Config is a list of objects with `practicum_token` and `chat_id`
+    keys. `telegram_token` is optional and defaults to `TELEGRAM_TOKEN`.
+    """
+    with open(path, encoding='utf-8') as file:
+        config = json.load(file)
+    if not isinstance(config, list):
+        raise TypeError('Tenants config must be a list')
+    tenants = []
+    for item in config:
+        if 'practicum_token' not in item or 'chat_id' not in item:
+            raise KeyError(
+                "tenant key access error: 'practicum_token' or 'chat_id'"
+            )
+        tenants.append(Tenant(
+            item['practicum_token'],
+            str(item['chat_id']),
+            item.get('telegram_token', homework.TELEGRAM_TOKEN)
+        ))
+    return tenants
+
+
+async def run_staggered(bot: AsyncHomeworkBot,
+                        offset: float,
+                        period: float) -> None:
+    """Poll on a fixed grid `offset + k * period` of loop time.
+
+    Grid keeps tenants evenly spread over the period even when
+    some polls take longer than others. Longer pause asked by the
+    scheduler, e.g. backoff after errors, skips grid points up to
+    the first one after the pause.
+    """
+    loop = asyncio.get_running_loop()
+    next_poll = loop.time() + offset
+    while True:
+        await asyncio.sleep(max(next_poll - loop.time(), 0))
+        pause = await bot.check_once()
+        next_poll += period * max(math.ceil(pause / period), 1)
+
+
+async def run_tenants(tenants: List[Tenant],
+                      endpoint: str = homework.ENDPOINT,
+                      telegram_api: str = TELEGRAM_API,
+                      period: float = homework.RETRY_PERIOD,
+                      connections_per_host: int = CONNECTIONS_PER_HOST
+                      ) -> None:
+    """Poll all tenants through one pooled HTTP session.
+
+    Tenant `i` of `n` polls at `i * period / n` offset, so requests
+    to `endpoint` are spread evenly instead of bursting.
+    """
+    connector = aiohttp.TCPConnector(limit_per_host=connections_per_host)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = []
+        for index, tenant in enumerate(tenants):
+            bot = AsyncHomeworkBot(session,
+                                   tenant.practicum_token,
+                                   tenant.telegram_token,
+                                   tenant.chat_id,
+                                   endpoint=endpoint,
+                                   telegram_api=telegram_api,
+                                   retry_period=period)
+            offset = index * period / len(tenants)
+            tasks.append(run_staggered(bot, offset, period))
+        await asyncio.gather(*tasks)
+
+
+def main() -> None:
+    """Run multi-tenant bot for tenants from config file."""
+    path = sys.argv[1] if len(sys.argv) > 1 else TENANTS_CONFIG
+    tenants = load_tenants(path)
+    if not tenants:
+        sys.exit('No tenants configured')
+    logger.info(f'Multi-tenant bot has started for {len(tenants)} tenants')
+    asyncio.run(run_tenants(tenants))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""Outgoing telegram messages queue with a background sender."""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import telegram
+
+import metrics
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+OUTBOX_MAXSIZE = 100
+CHAT_SEND_INTERVAL = 1.0
+COALESCE_DELAY = 0.5
+MAX_SEND_ATTEMPTS = 10
+SEND_RETRY_DELAY = 5.0
+MAX_SEND_RETRY_DELAY = 600.0
+
+logger = logging.getLogger(__name__)
+
+
+class Outbox:
+    """Bounded persistent queue of telegram messages.
+
+    Outbox looks like a bot to `send_message`: its `send_message` only
+    queues a message and returns at once, while a background thread
+    delivers queued messages through the real bot. Sender keeps at most
+    one message per `chat_interval` seconds for every chat, merges
+    everything queued for a chat meanwhile into one message and retries
+    failed sends with exponential pauses. Queue lives in SQLite, so with
+    a file path undelivered messages survive restart. When the queue
+    is full the oldest message is dropped.
+    """
+
+    def __init__(self,
+                 bot: telegram.Bot,
+                 path: str = ':memory:',
+                 maxsize: int = OUTBOX_MAXSIZE,
+                 chat_interval: float = CHAT_SEND_INTERVAL,
+                 coalesce_delay: float = COALESCE_DELAY,
+                 max_attempts: int = MAX_SEND_ATTEMPTS,
+                 retry_delay: float = SEND_RETRY_DELAY,
+                 limit: int = TELEGRAM_MESSAGE_LIMIT,
+                 log: logging.Logger = logger) -> None:
+        """Open queue storage and prepare sender thread."""
+        self.bot = bot
+        self.logger = log
+        self.maxsize = maxsize
+        self.chat_interval = chat_interval
+        self.coalesce_delay = coalesce_delay
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.limit = limit
+        self.last_sent: dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS outbox '
+                '(id INTEGER PRIMARY KEY AUTOINCREMENT, chat_id TEXT, '
+                'text TEXT, attempts INTEGER, next_attempt REAL)'
+            )
+        self.thread = threading.Thread(target=self._run,
+                                       name='telegram-outbox',
+                                       daemon=True)
+
+    def start(self) -> 'Outbox':
+        """Start background sender."""
+        self.thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop background sender; queued messages stay in storage."""
+        self.stopped.set()
+        self.wakeup.set()
+        self.thread.join(timeout)
+
+    def send_message(self, chat_id=None, text=None, **kwargs) -> None:
+        """Queue message for the chat."""
+        with self.lock, self.connection:
+            (size,) = self.connection.execute(
+                'SELECT COUNT(*) FROM outbox'
+            ).fetchone()
+            if size >= self.maxsize:
+                self.logger.warning(
+                    'Outbox is full, dropping oldest message'
+                )
+                self.connection.execute(
+                    'DELETE FROM outbox WHERE id = '
+                    '(SELECT MIN(id) FROM outbox)'
+                )
+            self.connection.execute(
+                'INSERT INTO outbox (chat_id, text, attempts, next_attempt) '
+                'VALUES (?, ?, 0, ?)',
+                (str(chat_id), text, time.time() + self.coalesce_delay)
+            )
+        self.wakeup.set()
+
+    def pending(self) -> int:
+        """Get number of queued messages."""
+        with self.lock:
+            (size,) = self.connection.execute(
+                'SELECT COUNT(*) FROM outbox'
+            ).fetchone()
+        return size
+
+    def _run(self) -> None:
+        while not self.stopped.is_set():
+            try:
+                delay = self.flush()
+            except Exception as error:
+                self.logger.exception(f'Outbox sender failed: {error}')
+                delay = self.retry_delay or CHAT_SEND_INTERVAL
+            self.wakeup.wait(delay)
+            self.wakeup.clear()
+
+    def _take_batch(self, rows: list) -> tuple[list[int], str]:
+        ids = [rows[0][0]]
+        text = rows[0][1]
+        for row_id, row_text in rows[1:]:
+            if len(text) + 2 + len(row_text) > self.limit:
+                break
+            ids.append(row_id)
+            text = f'{text}\n\n{row_text}'
+        return ids, text
+
+    def flush(self) -> Optional[float]:
+        """Send due messages and get seconds until the next send.
+
+        Chat with a failed send waits for its retry time even if new
+        messages are queued meanwhile. `None` means there is nothing
+        to send.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT id, chat_id, text, attempts, next_attempt '
+                'FROM outbox ORDER BY id'
+            ).fetchall()
+        chats: dict[str, list] = {}
+        for row in rows:
+            chats.setdefault(row[1], []).append(row)
+        delays = []
+        now = time.time()
+        for chat_id, chat_rows in chats.items():
+            retries = [row[4] for row in chat_rows if row[3]]
+            due = max(min(row[4] for row in chat_rows),
+                      min(retries, default=0),
+                      self.last_sent.get(chat_id, 0) + self.chat_interval)
+            if due > now:
+                delays.append(due - now)
+                continue
+            ids, text = self._take_batch(
+                [(row[0], row[2]) for row in chat_rows]
+            )
+            attempts = max(row[3] for row in chat_rows
+                           if row[0] in ids) + 1
+            self._send(chat_id, ids, text, attempts)
+            if len(ids) < len(chat_rows):
+                delays.append(self.chat_interval)
+        return min(delays, default=None)
+
+    def _send(self, chat_id: str, ids: list[int], text: str,
+              attempts: int) -> None:
+        placeholders = ', '.join('?' * len(ids))
+        try:
+            self.bot.send_message(chat_id=chat_id, text=text)
+        except telegram.error.TelegramError as error:
+            metrics.count_error('send_message', error)
+            self.last_sent[chat_id] = time.time()
+            if attempts >= self.max_attempts:
+                self.logger.error(f'Message dropped after {attempts} '
+                                  f'attempts: {error}')
+                with self.lock, self.connection:
+                    self.connection.execute(
+                        f'DELETE FROM outbox WHERE id IN ({placeholders})',
+                        ids
+                    )
+                return
+            pause = getattr(error, 'retry_after', None) or min(
+                self.retry_delay * 2 ** (attempts - 1), MAX_SEND_RETRY_DELAY
+            )
+            self.logger.error(f'Message sending failed, retry in {pause}s: '
+                              f'{error}')
+            with self.lock, self.connection:
+                self.connection.execute(
+                    'UPDATE outbox SET attempts = ?, next_attempt = ? '
+                    f'WHERE id IN ({placeholders})',
+                    [attempts, time.time() + pause, *ids]
+                )
+            return
+        self.last_sent[chat_id] = time.time()
+        self.logger.debug(f'Message successfully sent: \n{text}')
+        with self.lock, self.connection:
+            self.connection.execute(
+                f'DELETE FROM outbox WHERE id IN ({placeholders})', ids
+            )
@@ -0,0 +1,75 @@
+"""Adaptive choice of the pause between API polls."""
+
+import random
+from typing import Callable, Optional
+
+import exceptions
+
+REVIEWING_RETRY_PERIOD = 120
+IDLE_RETRY_PERIOD = 1800
+IDLE_AFTER_POLLS = 6
+MAX_BACKOFF_PERIOD = 3600
+BACKOFF_JITTER = 0.2
+BACKOFF_ERRORS = (exceptions.APIDoNotResponde, exceptions.JSONFormatException)
+
+
+class PollScheduler:
+    """Pick pause before the next poll from the result of the last one.
+
+    `statuses` is the live mapping of last known homework statuses
+    kept by the caller.
+
+    - while some homework is in `reviewing`, poll every `reviewing`
+      seconds;
+    - after `idle_after` polls in a row without changes, poll every
+      `idle` seconds;
+    - on API failures back off exponentially from `base` up to
+      `max_backoff` seconds with random jitter;
+    - otherwise poll every `base` seconds.
+    """
+
+    def __init__(self,
+                 base: float,
+                 statuses: Optional[dict[str, str]] = None,
+                 reviewing: float = REVIEWING_RETRY_PERIOD,
+                 idle: float = IDLE_RETRY_PERIOD,
+                 idle_after: int = IDLE_AFTER_POLLS,
+                 max_backoff: float = MAX_BACKOFF_PERIOD,
+                 jitter: float = BACKOFF_JITTER,
+                 uniform: Callable[[float, float], float] = random.uniform
+                 ) -> None:
+        """Set periods and reset counters."""
+        self.base = base
+        self.statuses = {} if statuses is None else statuses
+        self.reviewing = reviewing
+        self.idle = idle
+        self.idle_after = idle_after
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.uniform = uniform
+        self.failures = 0
+        self.quiet_polls = 0
+
+    def success(self, changed: bool) -> float:
+        """Get pause after a successful poll."""
+        self.failures = 0
+        if 'reviewing' in self.statuses.values():
+            self.quiet_polls = 0
+            return self.reviewing
+        if changed:
+            self.quiet_polls = 0
+            return self.base
+        self.quiet_polls += 1
+        if self.quiet_polls >= self.idle_after:
+            return self.idle
+        return self.base
+
+    def failure(self, error: Exception) -> float:
+        """Get pause after a failed poll."""
+        if isinstance(error, exceptions.APIResponseException):
+            return self.success(changed=False)
+        if not isinstance(error, BACKOFF_ERRORS):
+            return self.base
+        self.failures += 1
+        delay = min(self.base * 2 ** (self.failures - 1), self.max_backoff)
+        return delay * (1 + self.uniform(-self.jitter, self.jitter))
@@ -0,0 +1,94 @@
+"""Durable storage of the bot progress."""
+
+import json
+import sqlite3
+from typing import Dict, List, Optional
+
+
+class StateStore:
+    """SQLite storage of last API timestamp, error and homeworks.
+
+    With default `:memory:` path progress lives only while the process
+    runs; with a file path bot resumes from it after restart.
+    """
+
+    def __init__(self, path: str = ':memory:') -> None:
+        """Open database and create tables if needed."""
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS meta '
+                '(key TEXT PRIMARY KEY, value TEXT)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS statuses '
+                '(homework TEXT PRIMARY KEY, status TEXT)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS homeworks '
+                '(homework TEXT PRIMARY KEY, data TEXT)'
+            )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute(
+            'SELECT value FROM meta WHERE key = ?', (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                (key, value)
+            )
+
+    def get_timestamp(self, default: int) -> int:
+        """Return last saved `current_date` or `default`."""
+        value = self._get_meta('timestamp')
+        return default if value is None else int(value)
+
+    def save_timestamp(self, timestamp: int) -> None:
+        """Save `current_date` of the last processed API response."""
+        self._set_meta('timestamp', str(timestamp))
+
+    def get_error(self) -> Optional[str]:
+        """Return last reported error."""
+        return self._get_meta('error')
+
+    def save_error(self, error: Optional[str]) -> None:
+        """Save last reported error."""
+        self._set_meta('error', error)
+
+    def get_statuses(self) -> Dict[str, str]:
+        """Return last seen status of every homework."""
+        return dict(self.connection.execute(
+            'SELECT homework, status FROM statuses'
+        ))
+
+    def save_status(self, homework: str, status: str) -> None:
+        """Save last seen status of the homework."""
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO statuses (homework, status) '
+                'VALUES (?, ?)',
+                (homework, status)
+            )
+
+    def get_homeworks(self) -> List[dict]:
+        """Return last seen API data of every homework."""
+        return [json.loads(data) for data, in self.connection.execute(
+            'SELECT data FROM homeworks ORDER BY rowid'
+        )]
+
+    def save_homework(self, homework: str, data: dict) -> None:
+        """Save last seen API data of the homework."""
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO homeworks (homework, data) '
+                'VALUES (?, ?)',
+                (homework, json.dumps(data, ensure_ascii=False))
+            )
+
+    def close(self) -> None:
+        """Close database connection."""
+        self.connection.close()
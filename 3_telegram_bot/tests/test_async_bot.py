@@ -0,0 +1,61 @@
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+import async_bot
+import exceptions
+from utils import StubServer
+
+
+def run_bot(stub, checks=1):
+    async def scenario():
+        async with stub, aiohttp.ClientSession() as session:
+            bot = async_bot.AsyncHomeworkBot(
+                session, 'sometoken', '1234:abcdefg', '12345',
+                endpoint=stub.endpoint,
+                telegram_api=stub.telegram_api,
+                timestamp=0
+            )
+            for _ in range(checks):
+                await bot.check_once()
+            return bot
+    return asyncio.run(scenario())
+
+
+def test_check_once_sends_new_status():
+    stub = StubServer(homeworks=[
+        {'homework_name': 'hw123', 'status': 'approved'}])
+    bot = run_bot(stub, checks=2)
+    request = stub.api_requests[0]
+    assert request.headers['Authorization'] == 'OAuth sometoken'
+    assert request.query['from_date'] == '0'
+    assert stub.api_requests[1].query['from_date'] == '1000'
+    assert bot.timestamp == 1000
+    assert len(stub.messages) == 1
+    assert stub.messages[0]['chat_id'] == '12345'
+    assert 'Ура!' in stub.messages[0]['text']
+
+
+def test_check_once_reports_error_once():
+    stub = StubServer(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+    run_bot(stub, checks=3)
+    assert len(stub.messages) == 1
+    assert stub.messages[0]['text'].startswith('Program crash')
+
+
+@pytest.mark.parametrize('status, body, error', [
+    (HTTPStatus.SERVICE_UNAVAILABLE, None, exceptions.APIDoNotResponde),
+    (HTTPStatus.OK, 'not a json', exceptions.JSONFormatException),
+])
+def test_get_api_answer_async_errors(status, body, error):
+    stub = StubServer(status=status, body=body)
+
+    async def scenario():
+        async with stub, aiohttp.ClientSession() as session:
+            await async_bot.get_api_answer_async(
+                session, 0, 'sometoken', stub.endpoint)
+
+    with pytest.raises(error):
+        asyncio.run(scenario())
@@ -0,0 +1,128 @@
+import time
+
+import telegram
+
+from commands import (NO_DATA_MESSAGE, StatusCache, status_handler,
+                      status_reply)
+
+VERDICTS = {'approved': 'Approved.', 'reviewing': 'Reviewing.'}
+
+
+class FakeMessage:
+    def __init__(self):
+        self.replies = []
+
+    def reply_text(self, text):
+        self.replies.append(text)
+
+
+def make_cache():
+    return StatusCache(lambda homework: homework['homework_name'])
+
+
+def test_status_reply_without_data():
+    cache = make_cache()
+    handler = status_handler(cache, VERDICTS, '1')
+    message = FakeMessage()
+    handler.callback(type('Update', (), {'message': message}), None)
+    assert message.replies == [NO_DATA_MESSAGE]
+
+
+def test_cache_merges_responses():
+    cache = make_cache()
+    cache.update([{'homework_name': 'hw1', 'status': 'reviewing'},
+                  {'homework_name': 'hw2', 'status': 'reviewing'}])
+    cache.update([{'homework_name': 'hw1', 'status': 'approved'}])
+    homeworks, updated = cache.get()
+    assert homeworks == [{'homework_name': 'hw1', 'status': 'approved'},
+                         {'homework_name': 'hw2', 'status': 'reviewing'}]
+    assert updated <= time.time()
+
+    message = FakeMessage()
+    status_handler(cache, VERDICTS, '1').callback(
+        type('Update', (), {'message': message}), None
+    )
+    reply = message.replies[0]
+    assert '"hw1": Approved.' in reply
+    assert '"hw2": Reviewing.' in reply
+    assert 'Last check:' in reply
+
+
+def test_cache_seeded_and_touched():
+    homework = {'homework_name': 'hw1', 'status': 'approved'}
+    cache = StatusCache(lambda homework: homework['homework_name'],
+                        [homework])
+    assert cache.get() == ([homework], None)
+    reply = status_reply(cache, VERDICTS)
+    assert '"hw1": Approved.' in reply
+    assert 'Last check: not yet since restart' in reply
+
+    cache.touch()
+    assert cache.get()[1] <= time.time()
+    assert 'not yet' not in status_reply(cache, VERDICTS)
+
+
+def test_status_handler_answers_owner_chat_only():
+    handler = status_handler(make_cache(), VERDICTS, '1')
+    assert handler.command == ['status']
+
+    def command_update(chat_id):
+        chat = telegram.Chat(chat_id, 'private')
+        message = telegram.Message(
+            1, None, chat, text='/status',
+            entities=[telegram.MessageEntity('bot_command', 0, 7)],
+            bot=type('Bot', (), {'username': 'homework_bot'})
+        )
+        return telegram.Update(1, message=message)
+
+    assert handler.check_update(command_update(1))
+    assert not handler.check_update(command_update(2))
+
+
+def test_main_caches_checked_homeworks(monkeypatch, homework_module):
+    caches = []
+    homework = {'homework_name': 'hw1', 'status': 'approved'}
+
+    def start_services(bot, cache):
+        caches.append(cache)
+        return bot
+
+    def stop(delay):
+        raise SystemExit
+
+    monkeypatch.setattr(homework_module, 'start_services', start_services)
+    monkeypatch.setattr(homework_module, 'get_api_answer', lambda ts: {
+        'homeworks': [homework], 'current_date': 1000
+    })
+    monkeypatch.setattr(homework_module, 'send_message', lambda *args: None)
+    monkeypatch.setattr(homework_module.time, 'sleep', stop)
+    try:
+        homework_module.main()
+    except SystemExit:
+        pass
+    assert caches[0].get()[0] == [homework]
+
+
+def test_main_records_check_without_homeworks(monkeypatch, homework_module):
+    caches = []
+
+    def start_services(bot, cache):
+        caches.append(cache)
+        return bot
+
+    def stop(delay):
+        raise SystemExit
+
+    monkeypatch.setattr(homework_module, 'start_services', start_services)
+    monkeypatch.setattr(homework_module, 'get_api_answer', lambda ts: {
+        'homeworks': [], 'current_date': 1000
+    })
+    monkeypatch.setattr(homework_module, 'send_message', lambda *args: None)
+    monkeypatch.setattr(homework_module.time, 'sleep', stop)
+    try:
+        homework_module.main()
+    except SystemExit:
+        pass
+    assert caches[0].get()[1] is not None, (
+        'Every successful API answer should count as a check.'
+    )
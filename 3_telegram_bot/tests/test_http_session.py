@@ -0,0 +1,93 @@
+import gzip
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+import homework
+from http_session import ConditionalSession
+
+ETAG = '"v1"'
+BODY = {'homeworks': [], 'current_date': 1000}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.ports.add(self.client_address[1])
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = gzip.compress(json.dumps(BODY).encode())
+        self.send_response(HTTPStatus.OK)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.ports = set()
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_conditional_session(server):
+    url = f'http://127.0.0.1:{server.server_port}/statuses/'
+    session = ConditionalSession()
+    responses = [session.get(url, params={'from_date': from_date})
+                 for from_date in range(0, 5000, 1000)]
+    assert responses[0].json() == BODY
+    assert not hasattr(responses[0], 'from_cache')
+    assert all(response.from_cache and response.json() == BODY
+               for response in responses[1:]), (
+        'На 304 сессия должна вернуть сохранённый ответ.'
+    )
+    assert 'If-None-Match' not in server.requests[0]
+    assert all(request['If-None-Match'] == ETAG
+               for request in server.requests[1:]), (
+        'Сдвиг from_date не должен отключать условные запросы.'
+    )
+    assert len(session.cache) == 1, 'Кэш хранит один ответ на эндпоинт.'
+    assert 'gzip' in server.requests[0]['Accept-Encoding']
+    assert len(server.ports) == 1, 'Соединение должно переиспользоваться.'
+
+
+def test_conditional_session_is_bounded(server):
+    session = ConditionalSession(max_entries=2)
+    for path in ('first', 'second', 'third'):
+        session.get(f'http://127.0.0.1:{server.server_port}/{path}/')
+    assert [urlsplit(url).path for url in session.cache] == [
+        '/second/', '/third/'
+    ]
+
+
+def test_get_api_answer_uses_session(server, monkeypatch):
+    url = f'http://127.0.0.1:{server.server_port}/statuses/'
+    monkeypatch.setattr(homework, 'ENDPOINT', url)
+    monkeypatch.setattr(homework, 'HTTP_SESSION', ConditionalSession())
+    assert homework.get_api_answer(0) == BODY
+    assert homework.get_api_answer(2000) == {
+        'homeworks': [], 'current_date': 2000
+    }, 'Сохранённый ответ не должен сдвигать метку времени назад.'
+    assert len(server.requests) == 2
+    assert server.requests[1]['If-None-Match'] == ETAG
@@ -0,0 +1,75 @@
+import io
+import json
+import logging
+import threading
+from logging.handlers import QueueHandler
+
+from log_queue import (JSONFormatter, start_queue_logging,
+                       stop_queue_logging)
+
+
+class SlowHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.threads = []
+        self.records = []
+
+    def emit(self, record):
+        self.gate.wait(5)
+        self.threads.append(threading.current_thread().name)
+        self.records.append(self.format(record))
+
+
+def make_logger(name, *handlers):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    for handler in handlers:
+        logger.addHandler(handler)
+    return logger
+
+
+def test_json_formatter():
+    record = logging.LogRecord('bot', logging.ERROR, __file__, 1,
+                               'failed %s', ('poll',), None)
+    data = json.loads(JSONFormatter().format(record))
+    assert data['name'] == 'bot'
+    assert data['level'] == 'ERROR'
+    assert data['message'] == 'failed poll'
+    assert 'time' in data and 'thread' in data
+
+
+def test_logging_does_not_wait_for_handlers():
+    slow = SlowHandler()
+    logger = make_logger('test_log_queue.slow', slow)
+    start_queue_logging(logger)
+    try:
+        logger.info('Bot has started')
+        assert slow.records == []
+        slow.gate.set()
+    finally:
+        stop_queue_logging(logger)
+    assert slow.threads and slow.threads[0] != threading.current_thread().name
+    assert json.loads(slow.records[0])['message'] == 'Bot has started'
+
+
+def test_queue_logging_is_idempotent():
+    stream = io.StringIO()
+    logger = make_logger('test_log_queue.idempotent',
+                         logging.StreamHandler(stream))
+    listener = start_queue_logging(logger)
+    try:
+        assert start_queue_logging(logger) is listener
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], QueueHandler)
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            logger.exception('Program crash')
+    finally:
+        stop_queue_logging(logger)
+    assert isinstance(logger.handlers[0], logging.StreamHandler)
+    data = json.loads(stream.getvalue())
+    assert data['level'] == 'ERROR'
+    assert 'ValueError: boom' in data['message']
@@ -0,0 +1,73 @@
+import inspect
+import urllib.request
+
+import pytest
+
+import metrics
+
+
+def test_histogram_and_counter_render():
+    latency = metrics.Histogram('test_seconds', 'Test.', ('function',),
+                                buckets=(0.1, 1.0))
+    errors = metrics.Counter('test_errors_total', 'Test.', ('exception',))
+    latency.observe(0.05, function='poll')
+    latency.observe(0.5, function='poll')
+    errors.inc(exception='KeyError')
+    errors.inc(exception='KeyError')
+    text = metrics.render([latency, errors])
+    assert '# TYPE test_seconds histogram' in text
+    assert 'test_seconds_bucket{function="poll",le="0.1"} 1' in text
+    assert 'test_seconds_bucket{function="poll",le="1.0"} 2' in text
+    assert 'test_seconds_bucket{function="poll",le="+Inf"} 2' in text
+    assert 'test_seconds_count{function="poll"} 2' in text
+    assert 'test_errors_total{exception="KeyError"} 2' in text
+
+
+def test_metric_base_is_abstract():
+    with pytest.raises(TypeError):
+        metrics.Metric('test_total', 'Test.')
+
+
+def test_instrument_keeps_function_and_counts_errors():
+    @metrics.instrument
+    def test_metrics_func(homework: dict) -> str:
+        """Docstring."""
+        return homework['status']
+
+    assert test_metrics_func.__doc__ == 'Docstring.'
+    assert list(inspect.signature(test_metrics_func).parameters) == [
+        'homework'
+    ]
+    assert test_metrics_func({'status': 'approved'}) == 'approved'
+    with pytest.raises(KeyError):
+        test_metrics_func({})
+    assert metrics.LATENCY.count(function='test_metrics_func') == 2
+    assert metrics.ERRORS.get(function='test_metrics_func',
+                              exception='KeyError') == 1
+
+
+def test_homework_functions_are_instrumented(homework_module):
+    before = metrics.LATENCY.count(function='parse_status')
+    homework_module.parse_status(
+        {'homework_name': 'hw123', 'status': 'approved'}
+    )
+    assert metrics.LATENCY.count(function='parse_status') == before + 1
+    assert inspect.getdoc(homework_module.parse_status) == (
+        'Get homework status from API response.'
+    )
+
+
+def test_metrics_server():
+    assert metrics.start_metrics_server(None) is None
+    server = metrics.start_metrics_server(0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(
+            f'http://127.0.0.1:{port}/metrics'
+        ) as response:
+            body = response.read().decode()
+            assert response.headers['Content-Type'].startswith('text/plain')
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert '# TYPE bot_polls_total counter' in body
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+import multi_bot
+from utils import StubServer
+
+
+def test_load_tenants(tmp_path, monkeypatch):
+    monkeypatch.setattr(multi_bot.homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+    path = tmp_path / 'tenants.json'
+    path.write_text(json.dumps([
+        {'practicum_token': 'first', 'chat_id': 1},
+        {'practicum_token': 'second', 'chat_id': '2',
+         'telegram_token': '5678:hijklmn'},
+    ]))
+    assert multi_bot.load_tenants(str(path)) == [
+        multi_bot.Tenant('first', '1', '1234:abcdefg'),
+        multi_bot.Tenant('second', '2', '5678:hijklmn'),
+    ]
+
+
+def test_load_tenants_without_chat_id(tmp_path):
+    path = tmp_path / 'tenants.json'
+    path.write_text(json.dumps([{'practicum_token': 'first'}]))
+    with pytest.raises(KeyError):
+        multi_bot.load_tenants(str(path))
+
+
+def test_run_tenants_spreads_polls():
+    stub = StubServer(homeworks=[
+        {'homework_name': 'hw123', 'status': 'reviewing'}])
+    tenants = [multi_bot.Tenant(f'token{index}', str(index), '1234:abcdefg')
+               for index in range(4)]
+    period = 0.4
+
+    async def scenario():
+        async with stub:
+            try:
+                await asyncio.wait_for(
+                    multi_bot.run_tenants(tenants, stub.endpoint,
+                                          stub.telegram_api, period),
+                    timeout=period * 0.9
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    asyncio.run(scenario())
+    assert [request.headers['Authorization']
+            for request in stub.api_requests] == [
+        f'OAuth token{index}' for index in range(4)
+    ], 'Each tenant should poll once per period in offset order.'
+    assert sorted(message['chat_id'] for message in stub.messages) == [
+        '0', '1', '2', '3']
+
+
+def test_run_staggered_respects_scheduler_pause():
+    period, pause = 0.05, 0.12
+
+    class Bot:
+        def __init__(self):
+            self.polls = []
+
+        async def check_once(self):
+            self.polls.append(asyncio.get_running_loop().time())
+            return pause
+
+    bot = Bot()
+
+    async def scenario():
+        try:
+            await asyncio.wait_for(
+                multi_bot.run_staggered(bot, 0, period), timeout=0.4)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(scenario())
+    assert len(bot.polls) >= 2
+    intervals = [later - earlier
+                 for earlier, later in zip(bot.polls, bot.polls[1:])]
+    assert all(interval >= pause for interval in intervals), (
+        'Staggered poll should wait for the pause chosen by the scheduler.'
+    )
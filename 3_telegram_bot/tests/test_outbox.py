@@ -0,0 +1,156 @@
+import time
+
+import telegram
+
+import metrics
+from outbox import Outbox
+
+
+class RecordingBot:
+    def __init__(self, failures=0, error=None):
+        self.failures = failures
+        self.error = error or telegram.error.NetworkError('Something wrong')
+        self.sent = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        self.sent.append((chat_id, text))
+
+
+def make_outbox(bot, path=':memory:', **kwargs):
+    kwargs.setdefault('coalesce_delay', 0)
+    kwargs.setdefault('retry_delay', 0)
+    return Outbox(bot, path, **kwargs)
+
+
+def test_send_message_only_queues():
+    bot = RecordingBot()
+    outbox = make_outbox(bot)
+    outbox.send_message(chat_id=1, text='first')
+    assert bot.sent == []
+    assert outbox.pending() == 1
+
+
+def test_flush_coalesces_chat_messages():
+    bot = RecordingBot()
+    outbox = make_outbox(bot)
+    for text in ('first', 'second', 'third'):
+        outbox.send_message(chat_id=1, text=text)
+    outbox.send_message(chat_id=2, text='other')
+    outbox.flush()
+    assert bot.sent == [('1', 'first\n\nsecond\n\nthird'), ('2', 'other')]
+    assert outbox.pending() == 0
+
+
+def test_flush_respects_message_limit():
+    bot = RecordingBot()
+    outbox = make_outbox(bot, limit=13, chat_interval=0)
+    for text in ('first', 'second', 'third'):
+        outbox.send_message(chat_id=1, text=text)
+    outbox.flush()
+    outbox.flush()
+    assert bot.sent == [('1', 'first\n\nsecond'), ('1', 'third')]
+
+
+def test_flush_respects_chat_interval():
+    bot = RecordingBot()
+    outbox = make_outbox(bot, chat_interval=10)
+    outbox.send_message(chat_id=1, text='first')
+    outbox.flush()
+    outbox.send_message(chat_id=1, text='second')
+    delay = outbox.flush()
+    assert bot.sent == [('1', 'first')]
+    assert 9 < delay <= 10
+
+
+def test_failed_message_survives_restart(tmp_path):
+    path = str(tmp_path / 'outbox.sqlite3')
+    outbox = make_outbox(RecordingBot(failures=1), path)
+    outbox.send_message(chat_id=1, text='first')
+    outbox.flush()
+    assert outbox.pending() == 1
+
+    bot = RecordingBot()
+    make_outbox(bot, path).flush()
+    assert bot.sent == [('1', 'first')]
+
+
+def test_retry_after_is_respected():
+    bot = RecordingBot(failures=1, error=telegram.error.RetryAfter(30))
+    outbox = make_outbox(bot, chat_interval=0)
+    outbox.send_message(chat_id=1, text='first')
+    outbox.flush()
+    assert 29 < outbox.flush() <= 30
+    assert bot.sent == []
+
+
+def test_failed_send_is_counted():
+    labels = {'function': 'send_message', 'exception': 'NetworkError'}
+    before = metrics.ERRORS.get(**labels)
+    outbox = make_outbox(RecordingBot(failures=1), chat_interval=0)
+    outbox.send_message(chat_id=1, text='first')
+    outbox.flush()
+    assert metrics.ERRORS.get(**labels) == before + 1
+
+
+def test_new_message_waits_for_retry_after():
+    bot = RecordingBot(failures=1, error=telegram.error.RetryAfter(60))
+    outbox = make_outbox(bot, chat_interval=0)
+    outbox.send_message(chat_id=1, text='a')
+    outbox.flush()
+    outbox.send_message(chat_id=1, text='b')
+    assert 59 < outbox.flush() <= 60
+    assert bot.sent == [], 'New message must not cut flood-control pause.'
+
+
+def test_sender_survives_unexpected_error():
+    class BrokenBot(RecordingBot):
+        broken = True
+
+        def send_message(self, chat_id=None, text=None, **kwargs):
+            if self.broken:
+                self.broken = False
+                raise RuntimeError('database is locked')
+            super().send_message(chat_id, text)
+
+    bot = BrokenBot()
+    outbox = make_outbox(bot, chat_interval=0, retry_delay=0.01).start()
+    outbox.send_message(chat_id=1, text='first')
+    deadline = time.time() + 2
+    while not bot.sent and time.time() < deadline:
+        time.sleep(0.01)
+    outbox.stop(1)
+    assert bot.sent == [('1', 'first')]
+
+
+def test_message_dropped_after_max_attempts():
+    outbox = make_outbox(RecordingBot(failures=5), max_attempts=2,
+                         chat_interval=0)
+    outbox.send_message(chat_id=1, text='first')
+    outbox.flush()
+    outbox.flush()
+    assert outbox.pending() == 0
+
+
+def test_queue_is_bounded():
+    bot = RecordingBot()
+    outbox = make_outbox(bot, maxsize=2)
+    for text in ('first', 'second', 'third'):
+        outbox.send_message(chat_id=1, text=text)
+    assert outbox.pending() == 2
+    outbox.flush()
+    assert bot.sent == [('1', 'second\n\nthird')]
+
+
+def test_background_sender():
+    bot = RecordingBot()
+    outbox = make_outbox(bot).start()
+    outbox.send_message(chat_id=1, text='first')
+    deadline = time.time() + 2
+    while not bot.sent and time.time() < deadline:
+        time.sleep(0.01)
+    outbox.stop(timeout=2)
+    assert bot.sent == [('1', 'first')]
+    assert not outbox.thread.is_alive()
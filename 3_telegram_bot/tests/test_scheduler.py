@@ -0,0 +1,53 @@
+import pytest
+
+import exceptions
+from scheduler import PollScheduler
+
+
+def make_scheduler(statuses=None):
+    return PollScheduler(600, statuses, reviewing=120, idle=1800,
+                         idle_after=3, max_backoff=3600, jitter=0.2,
+                         uniform=lambda low, high: high)
+
+
+def test_reviewing_polls_faster():
+    statuses = {}
+    scheduler = make_scheduler(statuses)
+    assert scheduler.success(changed=True) == 600
+    statuses['1'] = 'reviewing'
+    assert scheduler.success(changed=True) == 120
+    assert scheduler.success(changed=False) == 120
+
+
+def test_idle_polls_slower():
+    scheduler = make_scheduler({'1': 'approved'})
+    assert [scheduler.success(changed=False) for _ in range(4)] == [
+        600, 600, 1800, 1800]
+    assert scheduler.failure(
+        exceptions.APIResponseException('no homeworks')) == 1800
+    assert scheduler.success(changed=True) == 600
+
+
+@pytest.mark.parametrize('error', [
+    exceptions.APIDoNotResponde('down'),
+    exceptions.JSONFormatException('broken'),
+])
+def test_backoff_with_jitter(error):
+    scheduler = make_scheduler()
+    delays = [scheduler.failure(error) for _ in range(5)]
+    assert delays == pytest.approx([720, 1440, 2880, 4320, 4320])
+    assert scheduler.success(changed=False) == 600
+    assert scheduler.failure(error) == pytest.approx(720)
+
+
+def test_backoff_jitter_is_random():
+    scheduler = PollScheduler(600)
+    delays = {scheduler.failure(exceptions.APIDoNotResponde('down'))
+              for _ in range(3)}
+    assert len(delays) == 3
+    assert all(480 <= delay <= 4320 for delay in delays)
+
+
+def test_other_errors_keep_base_period():
+    scheduler = make_scheduler()
+    assert scheduler.failure(KeyError('status')) == 600
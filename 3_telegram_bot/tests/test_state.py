@@ -0,0 +1,91 @@
+import time
+
+import pytest
+import requests
+import telegram
+
+import utils
+from state import StateStore
+
+
+def test_state_store_roundtrip(tmp_path):
+    path = str(tmp_path / 'state.sqlite3')
+    store = StateStore(path)
+    assert store.get_timestamp(42) == 42
+    assert store.get_statuses() == {}
+    assert store.get_error() is None
+    store.save_timestamp(1000)
+    store.save_status('hw1', 'reviewing')
+    store.save_status('hw1', 'approved')
+    store.save_status('hw2', 'rejected')
+    store.save_homework('hw1', {'homework_name': 'hw1', 'status': 'approved'})
+    store.save_error('boom')
+    store.close()
+
+    restored = StateStore(path)
+    assert restored.get_timestamp(42) == 1000
+    assert restored.get_statuses() == {'hw1': 'approved', 'hw2': 'rejected'}
+    assert restored.get_homeworks() == [
+        {'homework_name': 'hw1', 'status': 'approved'}]
+    assert restored.get_error() == 'boom'
+
+
+@pytest.fixture
+def bot_env(monkeypatch, tmp_path, homework_module):
+    sent = []
+    params = []
+
+    def mock_get(*args, **kwargs):
+        params.append(kwargs['params'])
+        response = utils.MockResponseGET(random_timestamp=1000)
+        response.json = lambda: {
+            'homeworks': [{'homework_name': 'hw123', 'status': 'approved'}],
+            'current_date': 1000,
+        }
+        return response
+
+    def sleep_to_interrupt(secs):
+        raise utils.BreakInfiniteLoop('break')
+
+    monkeypatch.setattr(requests, 'get', mock_get)
+    monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+    monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+    monkeypatch.setattr(homework_module, 'send_message',
+                        lambda bot, message: sent.append(message))
+    monkeypatch.setattr(homework_module, 'BOT_STATE_PATH',
+                        str(tmp_path / 'state.sqlite3'))
+    monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+    monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+    monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+    return sent, params
+
+
+def test_main_resumes_after_restart(bot_env, homework_module):
+    sent, params = bot_env
+    for _ in range(2):
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+    assert len(sent) == 1, (
+        'После перезапуска бот не должен повторно отправлять статус.'
+    )
+    assert params[1] == {'from_date': 1000}, (
+        'После перезапуска бот должен продолжать с сохранённой метки времени.'
+    )
+
+
+def test_main_seeds_status_cache_after_restart(bot_env, homework_module,
+                                               monkeypatch):
+    seeded = []
+
+    def start_services(bot, cache):
+        seeded.append(cache.get()[0])
+        return bot
+
+    monkeypatch.setattr(homework_module, 'start_services', start_services)
+    for _ in range(2):
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+    assert seeded[0] == []
+    assert seeded[1] == [
+        {'homework_name': 'hw123', 'status': 'approved'}
+    ], 'После перезапуска кэш /status должен заполняться из хранилища.'
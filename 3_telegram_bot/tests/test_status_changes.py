@@ -0,0 +1,58 @@
+import time
+
+import pytest
+import requests
+import telegram
+
+import utils
+
+HOMEWORKS = [
+    {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+    {'id': 2, 'homework_name': 'hw2', 'status': 'reviewing'},
+    {'homework_name': 'hw3', 'status': 'rejected'},
+]
+
+
+def test_get_status_changes(homework_module):
+    previous = {'1': 'approved', '2': 'approved', 'hw3': 'rejected'}
+    changes = homework_module.get_status_changes(HOMEWORKS, previous)
+    assert changes == [HOMEWORKS[1]], (
+        'Изменения должны определяться для каждой работы по её id или имени.'
+    )
+    assert homework_module.get_status_changes(HOMEWORKS, {}) == HOMEWORKS
+
+
+@pytest.mark.parametrize('messages, limit, expected', [
+    ([], 10, []),
+    (['aaa', 'bbb', 'ccc'], 100, ['aaa\n\nbbb\n\nccc']),
+    (['aaa', 'bbb', 'ccc'], 8, ['aaa\n\nbbb', 'ccc']),
+    (['aaaaaaaaaa', 'b'], 5, ['aaaaaaaaaa', 'b']),
+])
+def test_join_messages(homework_module, messages, limit, expected):
+    assert homework_module.join_messages(messages, limit) == expected
+
+
+def test_main_sends_all_changes_in_one_message(monkeypatch, homework_module):
+    sent = []
+
+    def mock_get(*args, **kwargs):
+        response = utils.MockResponseGET(random_timestamp=1000)
+        response.json = lambda: {'homeworks': HOMEWORKS, 'current_date': 1}
+        return response
+
+    def sleep_to_interrupt(secs):
+        raise utils.BreakInfiniteLoop('break')
+
+    monkeypatch.setattr(requests, 'get', mock_get)
+    monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+    monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+    monkeypatch.setattr(homework_module, 'send_message',
+                        lambda bot, message: sent.append(message))
+    monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+    monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+    monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+    with pytest.raises(utils.BreakInfiniteLoop):
+        homework_module.main()
+    assert len(sent) == 1
+    for homework in HOMEWORKS:
+        assert homework['homework_name'] in sent[0]
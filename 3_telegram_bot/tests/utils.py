@@ -5,6 +5,9 @@ from http import HTTPStatus
 from inspect import signature
 from types import ModuleType
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 
 def check_function(scope: ModuleType, func_name: str, params_qty: int = 0):
     """If scope has a function with specific name and params with qty."""
@@ -103,3 +106,49 @@ class MockTelegramBot:
 
 class BreakInfiniteLoop(Exception):
     pass
+
+
+API_PATH = '/api/user_api/homework_statuses/'
+
+
+class StubServer:
+    """Local stand-in for Practicum API and Telegram Bot API."""
+
+    def __init__(self, homeworks=None, status=HTTPStatus.OK, body=None):
+        self.homeworks = homeworks or []
+        self.status = status
+        self.body = body
+        self.api_requests = []
+        self.messages = []
+        app = web.Application()
+        app.router.add_get(API_PATH, self.homework_statuses)
+        app.router.add_post('/bot{token}/sendMessage', self.send_message)
+        self.server = TestServer(app)
+
+    async def homework_statuses(self, request):
+        self.api_requests.append(request)
+        if self.body is not None:
+            return web.Response(status=self.status, text=self.body)
+        return web.json_response(
+            {'homeworks': self.homeworks, 'current_date': 1000},
+            status=self.status
+        )
+
+    async def send_message(self, request):
+        self.messages.append(await request.json())
+        return web.json_response({'ok': True})
+
+    @property
+    def endpoint(self):
+        return str(self.server.make_url(API_PATH))
+
+    @property
+    def telegram_api(self):
+        return str(self.server.make_url('')).rstrip('/')
+
+    async def __aenter__(self):
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.server.close()